@@ -17,9 +17,11 @@ from src.agent_server.core.orm import Base
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+# This line sets up loggers basically. The server runs migrations in-process
+# and opts out via config.attributes so its own logging setup survives; the
+# CLI keeps alembic.ini logging without disabling loggers created on import.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
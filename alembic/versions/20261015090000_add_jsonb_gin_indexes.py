@@ -0,0 +1,45 @@
+"""Add GIN jsonb_path_ops index for JSONB containment queries
+
+Thread search filters on ``thread.metadata_json`` using the ``@>``
+containment operator, which GIN can serve with a bitmap index scan instead
+of a sequential scan. ``jsonb_path_ops`` only supports ``@>`` but yields a
+considerably smaller index than the default ``jsonb_ops`` class.
+
+Revision ID: f30cc8ef28a9
+Revises: 7b79bfd12626
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f30cc8ef28a9'
+down_revision = '7b79bfd12626'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create GIN index on thread metadata."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_thread_metadata_gin',
+            'thread',
+            ['metadata_json'],
+            postgresql_using='gin',
+            postgresql_ops={'metadata_json': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop GIN index on thread metadata."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_thread_metadata_gin',
+            table_name='thread',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,61 @@
+"""Replace single-column run FK indexes with composite and partial variants
+
+- ``(thread_id, created_at DESC)`` serves the per-thread run listing,
+  including its ``ORDER BY created_at DESC``, without a separate sort.
+- ``(assistant_id, status)`` serves assistant joins filtered by run state.
+- A partial ``(status, created_at)`` index covers only active runs, which
+  stays small no matter how many finished runs accumulate.
+
+Revision ID: 19d5526ffe76
+Revises: f30cc8ef28a9
+Create Date: 2026-10-15 09:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '19d5526ffe76'
+down_revision = 'f30cc8ef28a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap plain run indexes for composite/partial ones."""
+    # CONCURRENTLY avoids blocking writes to runs, but cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_runs_thread_created',
+            'runs',
+            ['thread_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_runs_assistant_status',
+            'runs',
+            ['assistant_id', 'status'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_runs_active',
+            'runs',
+            ['status', 'created_at'],
+            postgresql_where=sa.text("status IN ('pending', 'running', 'streaming')"),
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index('idx_runs_thread_id', table_name='runs', postgresql_concurrently=True)
+        op.drop_index('idx_runs_assistant_id', table_name='runs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the original single-column run indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_runs_assistant_id', 'runs', ['assistant_id'], postgresql_concurrently=True)
+        op.create_index('idx_runs_thread_id', 'runs', ['thread_id'], postgresql_concurrently=True)
+
+        op.drop_index('idx_runs_active', table_name='runs', postgresql_concurrently=True)
+        op.drop_index('idx_runs_assistant_status', table_name='runs', postgresql_concurrently=True)
+        op.drop_index('idx_runs_thread_created', table_name='runs', postgresql_concurrently=True)
@@ -0,0 +1,101 @@
+"""Store assistant, thread and run identifiers as native UUID
+
+Identifiers were stored as TEXT, so every primary key, foreign key and
+index compared 36-byte strings. Native ``uuid`` is a fixed 16-byte value,
+which roughly halves the size of every index built on these columns.
+
+``run_events.id`` stays TEXT: it is the composite ``<run_id>_event_<seq>``
+key used for SSE replay, not a UUID.
+
+Revision ID: ebeabf608b89
+Revises: 19d5526ffe76
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ebeabf608b89'
+down_revision = '19d5526ffe76'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs converted by this migration, parents first
+UUID_COLUMNS = [
+    ('assistant', 'assistant_id'),
+    ('thread', 'thread_id'),
+    ('runs', 'run_id'),
+    ('runs', 'thread_id'),
+    ('runs', 'assistant_id'),
+    ('run_events', 'run_id'),
+]
+
+# Columns with a DB-side generated default
+DEFAULTED_COLUMNS = [('assistant', 'assistant_id'), ('runs', 'run_id')]
+
+
+def _drop_run_foreign_keys() -> None:
+    op.drop_constraint('runs_assistant_id_fkey', 'runs', type_='foreignkey')
+    op.drop_constraint('runs_thread_id_fkey', 'runs', type_='foreignkey')
+
+
+def _create_run_foreign_keys() -> None:
+    op.create_foreign_key('runs_assistant_id_fkey', 'runs', 'assistant', ['assistant_id'], ['assistant_id'])
+    op.create_foreign_key('runs_thread_id_fkey', 'runs', 'thread', ['thread_id'], ['thread_id'])
+
+
+def _check_uuid_values() -> None:
+    """Fail before any DDL if an identifier column holds a non-UUID value.
+
+    Older deployments accepted arbitrary client-supplied ids, which the
+    ``::uuid`` cast below would reject halfway through the conversion.
+    """
+    if op.get_context().as_sql:
+        return
+    bind = op.get_bind()
+    offenders = []
+    for table, column in UUID_COLUMNS:
+        count = bind.execute(sa.text(
+            f"SELECT count(*) FROM {table} "
+            f"WHERE regexp_replace({column}, '[{{}}-]', '', 'g') !~* '^[0-9a-f]{{32}}$'"
+        )).scalar()
+        if count:
+            offenders.append(f"{table}.{column}: {count} row(s)")
+    if offenders:
+        raise RuntimeError(
+            "Cannot convert identifier columns to uuid; non-UUID values found in "
+            + ", ".join(offenders)
+            + ". Rewrite or delete those rows, then re-run the migration."
+        )
+
+
+def upgrade() -> None:
+    """Convert identifier columns from TEXT to UUID."""
+    _check_uuid_values()
+    _drop_run_foreign_keys()
+    for table, column in DEFAULTED_COLUMNS:
+        op.alter_column(table, column, server_default=None)
+
+    for table, column in UUID_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid')
+
+    for table, column in DEFAULTED_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('uuid_generate_v4()'))
+    _create_run_foreign_keys()
+
+
+def downgrade() -> None:
+    """Convert identifier columns back to TEXT."""
+    _drop_run_foreign_keys()
+    for table, column in DEFAULTED_COLUMNS:
+        op.alter_column(table, column, server_default=None)
+
+    for table, column in reversed(UUID_COLUMNS):
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE text USING {column}::text')
+
+    for table, column in DEFAULTED_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('uuid_generate_v4()::text'))
+    _create_run_foreign_keys()
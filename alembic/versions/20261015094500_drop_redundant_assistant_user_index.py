@@ -0,0 +1,31 @@
+"""Drop redundant single-column assistant user index
+
+``idx_assistant_user_graph`` on ``(user_id, graph_id)`` already serves
+``WHERE user_id = ...`` lookups through its leading column, so the separate
+``idx_assistant_user`` only adds write amplification and cache footprint.
+
+Revision ID: 8b1e087f8c35
+Revises: ebeabf608b89
+Create Date: 2026-10-15 09:45:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1e087f8c35'
+down_revision = 'ebeabf608b89'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop idx_assistant_user."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_assistant_user', table_name='assistant', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Recreate idx_assistant_user."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_assistant_user', 'assistant', ['user_id'], postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""Replace runs.created_at btree with a BRIN index
+
+``runs`` is append-only and ``created_at`` grows with physical row order,
+so a BRIN index (min/max per block range) answers time-window scans while
+being orders of magnitude smaller and cheaper to maintain than a btree.
+
+Revision ID: 17ac8ad4ba8d
+Revises: 8b1e087f8c35
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '17ac8ad4ba8d'
+down_revision = '8b1e087f8c35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap idx_runs_created_at for a BRIN index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_runs_created_at_brin',
+            'runs',
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+        op.drop_index('idx_runs_created_at', table_name='runs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the btree index on runs.created_at."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_runs_created_at', 'runs', ['created_at'], postgresql_concurrently=True)
+        op.drop_index('idx_runs_created_at_brin', table_name='runs', postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""Store run_events.data as BYTEA of pre-serialized JSON
+
+Event payloads are only ever replayed verbatim, never queried into, so
+parsing them into JSONB on write (and rendering back to text on read) is
+wasted work. The writer now sends UTF-8 JSON bytes directly.
+
+Revision ID: 42d2725f45fd
+Revises: 17ac8ad4ba8d
+Create Date: 2026-10-15 10:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '42d2725f45fd'
+down_revision = '17ac8ad4ba8d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert run_events.data from JSONB to BYTEA."""
+    op.execute(
+        "ALTER TABLE run_events ALTER COLUMN data TYPE bytea "
+        "USING convert_to(data::text, 'UTF8')"
+    )
+
+
+def downgrade() -> None:
+    """Convert run_events.data back to JSONB."""
+    op.execute(
+        "ALTER TABLE run_events ALTER COLUMN data TYPE jsonb "
+        "USING convert_from(data, 'UTF8')::jsonb"
+    )
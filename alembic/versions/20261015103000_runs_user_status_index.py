@@ -0,0 +1,38 @@
+"""Replace runs user index with a (user_id, status) composite
+
+Run listings are always scoped to the requesting user and commonly filtered
+by status. The composite serves both shapes, and its leading ``user_id``
+column covers the user-only lookups the old single-column index handled.
+
+Revision ID: bfb6f600a1b7
+Revises: 42d2725f45fd
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'bfb6f600a1b7'
+down_revision = '42d2725f45fd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap idx_runs_user for idx_runs_user_status."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_runs_user_status',
+            'runs',
+            ['user_id', 'status'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('idx_runs_user', table_name='runs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore idx_runs_user."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_runs_user', 'runs', ['user_id'], postgresql_concurrently=True)
+        op.drop_index('idx_runs_user_status', table_name='runs', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+"""Add trigram GIN indexes for assistant name/description search
+
+Assistant search filters with ``ILIKE '%term%'``. A leading wildcard defeats
+btree indexes, but ``pg_trgm`` GIN indexes can serve it directly.
+
+Revision ID: 436312a5cd30
+Revises: bfb6f600a1b7
+Create Date: 2026-10-15 10:45:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '436312a5cd30'
+down_revision = 'bfb6f600a1b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and index assistant name/description."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_assistant_name_trgm',
+            'assistant',
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_assistant_description_trgm',
+            'assistant',
+            ['description'],
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop assistant trigram indexes (pg_trgm is left installed)."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_assistant_description_trgm', table_name='assistant', postgresql_concurrently=True)
+        op.drop_index('idx_assistant_name_trgm', table_name='assistant', postgresql_concurrently=True)
@@ -1,5 +1,6 @@
 import os
-import json
+
+import orjson
 
 try:
     from langgraph_sdk import get_client
@@ -10,7 +11,7 @@ except Exception as e:
 def elog(title: str, payload):
     """Emit pretty JSON logs for E2E visibility."""
     try:
-        formatted = json.dumps(payload, ensure_ascii=False, indent=2, default=str)
+        formatted = orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2).decode()
     except Exception:
         formatted = str(payload)
     print(f"\n=== {title} ===\n{formatted}\n")
@@ -0,0 +1,11 @@
+import pytest_asyncio
+
+from e2e._utils import get_e2e_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def e2e_client():
+    """One SDK client (and connection pool) shared by every E2E test."""
+    client = get_e2e_client()
+    yield client
+    await client.aclose()
@@ -1,10 +1,10 @@
 import pytest
-from e2e._utils import get_e2e_client, elog
+from e2e._utils import elog
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_background_run_and_join_e2e():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_background_run_and_join_e2e(e2e_client):
     """
     End-to-end test that:
       1) Creates a background run (non-streaming)
@@ -15,7 +15,7 @@ async def test_background_run_and_join_e2e():
 
     This mirrors the standalone script semantics while using the e2e helpers.
     """
-    client = get_e2e_client()
+    client = e2e_client
 
     # Ensure assistant exists
     assistant = await client.assistants.create(
@@ -1,15 +1,15 @@
 import pytest
-from e2e._utils import get_e2e_client, elog
+from e2e._utils import elog
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_chat_streaming_e2e():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_chat_streaming_e2e(e2e_client):
     """
     End-to-end test for streaming a run via SDK.
     Consumes SSE until completion and validates end-of-stream behavior.
     """
-    client = get_e2e_client()
+    client = e2e_client
 
     # Ensure assistant exists
     assistant = await client.assistants.create(
@@ -41,11 +41,12 @@ async def test_chat_streaming_e2e():
     token_count = 0
     completed = False
     async for chunk in stream:
+        # StreamPart is a NamedTuple: event/data always exist, bind them once
+        event, data = chunk.event, chunk.data
         event_count += 1
-        elog("Runs.stream event", {"event": getattr(chunk, "event", None), "data": getattr(chunk, "data", None)})
+        elog("Runs.stream event", {"event": event, "data": data})
 
-        if getattr(chunk, "event", None) == "messages":
-            data = getattr(chunk, "data", None)
+        if event == "messages":
             if isinstance(data, list) and len(data) >= 1:
                 message_chunk = data[0]
                 # message_chunk can be a pydantic object or plain dict
@@ -55,7 +56,7 @@ async def test_chat_streaming_e2e():
                 if content:
                     token_count += 1
 
-        if getattr(chunk, "event", None) == "end":
+        if event == "end":
             completed = True
             break
 
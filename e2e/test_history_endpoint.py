@@ -1,16 +1,16 @@
 import pytest
-from e2e._utils import get_e2e_client, elog
+from e2e._utils import elog
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_history_endpoint_e2e():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_history_endpoint_e2e(e2e_client):
     """
     End-to-end test against a running server using the LangGraph SDK.
     This verifies assistant creation, run execution, join endpoint, and history retrieval.
     Requires the server to be running and accessible.
     """
-    client = get_e2e_client()
+    client = e2e_client
 
     # Create an assistant (idempotent if server supports if_exists/do_nothing)
     assistant = await client.assistants.create(
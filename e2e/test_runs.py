@@ -1,11 +1,11 @@
 import pytest
 # Match import style used by other e2e tests when run as top-level modules
-from e2e._utils import get_e2e_client, elog
+from e2e._utils import elog
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_runs_crud_and_join_e2e():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_runs_crud_and_join_e2e(e2e_client):
     """
     Mirrors existing e2e style using the typed SDK client (see test_chat_streaming, test_background_run_join).
     Validates the non-streaming "background run" flow and CRUD around it:
@@ -17,7 +17,7 @@ async def test_runs_crud_and_join_e2e():
       6) List runs for the same thread and ensure presence
       7) Stream endpoint for a terminal run should yield an end event quickly via SDK wrapper
     """
-    client = get_e2e_client()
+    client = e2e_client
 
     # 1) Assistant
     assistant = await client.assistants.create(
@@ -73,16 +73,16 @@ async def test_runs_crud_and_join_e2e():
         run_id=run_id,
         stream_mode=["messages", "values"],
     ):
-        elog("Runs.stream(terminal) event", {"event": getattr(chunk, "event", None)})
-        if getattr(chunk, "event", None) == "end":
+        elog("Runs.stream(terminal) event", {"event": chunk.event})
+        if chunk.event == "end":
             end_seen = True
             break
     assert end_seen, "Expected an 'end' event when streaming a terminal run"
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_runs_cancel_e2e():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_runs_cancel_e2e(e2e_client):
     """
     Cancellation flow aligned with e2e client helpers:
       1) Create assistant and thread
@@ -90,7 +90,7 @@ async def test_runs_cancel_e2e():
       3) Cancel the run via SDK
       4) Verify status is cancelled/interrupted/final afterward
     """
-    client = get_e2e_client()
+    client = e2e_client
 
     # Assistant + thread
     assistant = await client.assistants.create(
@@ -114,7 +114,7 @@ async def test_runs_cancel_e2e():
     events_seen = 0
     async for chunk in stream:
         events_seen += 1
-        elog("Runs.stream (pre-cancel)", {"event": getattr(chunk, "event", None)})
+        elog("Runs.stream (pre-cancel)", {"event": chunk.event})
         # Try to fetch a run id by listing runs; server persists runs metadata now
         if events_seen >= 2:
             break
@@ -1,11 +1,11 @@
 import pytest
-from e2e._utils import get_e2e_client, elog
+from e2e._utils import elog
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_store_endpoints_via_sdk():
-    client = get_e2e_client()
+@pytest.mark.asyncio(loop_scope="session")
+async def test_store_endpoints_via_sdk(e2e_client):
+    client = e2e_client
 
     # Use a user-private namespace implicitly; server will scope to ["users", <identity>]
     # Insert item
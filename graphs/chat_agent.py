@@ -6,21 +6,35 @@ This is the real test for our streaming implementation.
 State: Just messages (list of messages)
 """
 
-from typing import TypedDict, List, Any
+from functools import cache, lru_cache
+from typing import Annotated, TypedDict, List, Any
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_openai import ChatOpenAI
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, add_messages, END
 import os
 
 
 class ChatState(TypedDict):
     """Simple state with just messages"""
-    messages: List[BaseMessage]
+    messages: Annotated[List[BaseMessage], add_messages]
 
 
 from langchain_core.runnables import RunnableConfig
 
 
+@lru_cache(maxsize=32)
+def _get_llm(model: str, temperature: float) -> ChatOpenAI:
+    """Return a shared client so its HTTP connection pool survives across turns"""
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        api_key=os.getenv("OPENAI_API_KEY"),
+        # Emit tokens through callbacks so stream_mode="messages" gets them
+        # as they arrive rather than after the full completion
+        streaming=True,
+    )
+
+
 async def call_llm(state: ChatState, config: RunnableConfig | None = None) -> ChatState:
     """Call the LLM with the current messages.
 
@@ -28,12 +42,8 @@ async def call_llm(state: ChatState, config: RunnableConfig | None = None) -> Ch
     ``config`` to prove the server’s pass-through behaviour.
     """
 
-    # Initialize OpenAI LLM
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0.7,
-        api_key=os.getenv("OPENAI_API_KEY"),    
-        )
+    # Reuse the cached OpenAI LLM client
+    llm = _get_llm("gpt-4o-mini", 0.7)
     
     # Get the messages from state
     messages = state["messages"]
@@ -41,14 +51,13 @@ async def call_llm(state: ChatState, config: RunnableConfig | None = None) -> Ch
     # Call the LLM
     response = await llm.ainvoke(messages)
     
-    # Add the response to messages
-    updated_messages = messages + [response]
-    
-    return {"messages": updated_messages}
+    # add_messages appends the response to the existing history
+    return {"messages": [response]}
 
 
+@cache
 def create_chat_graph():
-    """Create a simple chat graph"""
+    """Create a simple chat graph (compiled once per process)"""
     
     # Create the graph
     workflow = StateGraph(ChatState)
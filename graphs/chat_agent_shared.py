@@ -6,19 +6,25 @@ Maintains Aegra scaffolding for proper integration.
 State: Just messages (list of messages)
 """
 
-from typing import TypedDict, List, Any
+from functools import cache
+from typing import Annotated, TypedDict, List, Any
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, add_messages, END
 
-# Import shared logic
+# Import shared logic from the sibling agents/ directory (same location
+# aegra.json points at with "../agents/...")
 import sys
-sys.path.append('/Users/niladribose/code/ScottishAILessons/agents')
+from pathlib import Path
+
+_SHARED_AGENTS_DIR = str(Path(__file__).resolve().parent.parent.parent / "agents")
+if _SHARED_AGENTS_DIR not in sys.path:
+    sys.path.insert(0, _SHARED_AGENTS_DIR)
 from shared_chat_logic import chat_node
 
 
 class ChatState(TypedDict):
     """Simple state with just messages"""
-    messages: List[BaseMessage]
+    messages: Annotated[List[BaseMessage], add_messages]
 
 
 from langchain_core.runnables import RunnableConfig
@@ -48,14 +54,15 @@ async def call_llm(state: ChatState, config: RunnableConfig | None = None) -> Ch
                 # Add run-- prefix to match expected format
                 id=f"run--{last_msg.id}" if hasattr(last_msg, 'id') and last_msg.id else f"run--{id(last_msg)}"
             )
-            # Return messages with the converted chunk
-            return {"messages": messages[:-1] + [chunk]}
+            # add_messages merges earlier messages by id; only the chunk is new
+            return {"messages": [chunk]}
     
     return result
 
 
+@cache
 def create_chat_graph():
-    """Create a simple chat graph"""
+    """Create a simple chat graph (compiled once per process)"""
     
     # Create the graph
     workflow = StateGraph(ChatState)
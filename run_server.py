@@ -59,12 +59,20 @@ def main():
     print("📊 API docs will be available at: http://localhost:8000/docs")
     print("🧪 Test with: python test_sdk_integration.py")
 
+    # Reloader and multiple workers are mutually exclusive in uvicorn
+    reload = os.getenv("AEGRA_ENV") == "development"
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", "1"))
+
     uvicorn.run(
         "src.agent_server.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level=os.getenv("UVICORN_LOG_LEVEL", "debug"),
+        reload=reload,
+        workers=workers,
+        log_level=os.getenv("UVICORN_LOG_LEVEL", "warning"),
+        # "auto" picks uvloop/httptools when installed, else asyncio/h11
+        loop="auto",
+        http="auto",
     )
 
 if __name__ == "__main__":
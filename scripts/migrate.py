@@ -1,32 +1,68 @@
 #!/usr/bin/env python3
 """Database migration management script for Aegra."""
+import argparse
 import os
 import sys
-import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from alembic import command as command_api
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import make_url
+
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
-def run_command(cmd: str, description: str = ""):
-    """Run a command and handle errors."""
+def run_command(fn, *args, description: str = "", **kwargs):
+    """Run an Alembic command in-process and handle errors."""
     if description:
         print(f"🔄 {description}")
     
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
+        fn(*args, **kwargs)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running '{cmd}': {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
+    except Exception as e:
+        print(f"❌ Error running alembic {fn.__name__}: {e}")
         return False
 
 
+def _upgrade_database(database_url: str) -> str:
+    """Upgrade one database to head. Runs in a worker process."""
+    # env.py resolves the URL from DATABASE_URL; each worker has its own environment
+    os.environ["DATABASE_URL"] = database_url
+    command_api.upgrade(Config(str(project_root / "alembic.ini")), "head")
+    return database_url
+
+
+def _display_url(database_url: str) -> str:
+    """Render a database URL for output with its password masked."""
+    try:
+        return make_url(database_url).render_as_string(hide_password=True)
+    except Exception:
+        return "<unparseable database URL>"
+
+
+def upgrade_all(database_urls: list[str]) -> bool:
+    """Upgrade several databases in parallel, one Alembic run per process."""
+    max_workers = max(1, min(len(database_urls), (os.cpu_count() or 2) // 2))
+    failed = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_upgrade_database, url): url for url in database_urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                future.result()
+                print(f"✅ {_display_url(url)}")
+            except Exception as e:
+                # Keep going so one bad database does not block the rest
+                print(f"❌ {_display_url(url)}: {e}")
+                failed.append(url)
+    return not failed
+
+
 def main():
     """Main migration management function."""
     if len(sys.argv) < 2:
@@ -39,9 +75,11 @@ Usage:
 Commands:
   init          - Initialize Alembic (first time setup)
   upgrade       - Apply all pending migrations
+  upgrade-all   - Apply migrations to every URL in DATABASE_URLS (comma-separated), in parallel
   downgrade     - Rollback last migration
   revision      - Create a new migration file
   history       - Show migration history
+  heads         - Verify the migration tree has exactly one head
   current       - Show current migration version
   reset         - Reset database (drop all tables and reapply migrations)
   
@@ -57,48 +95,64 @@ Examples:
     # Change to project root directory
     os.chdir(project_root)
     
+    # One Config shared by every command in this invocation
+    cfg = Config(str(project_root / "alembic.ini"))
+
     if command == "init":
         print("🚀 Initializing Alembic...")
-        if not run_command("alembic init alembic", "Creating Alembic directory"):
+        if not run_command(command_api.init, cfg, "alembic", description="Creating Alembic directory"):
             return
         print("✅ Alembic initialized! You may need to update alembic.ini and env.py")
         
     elif command == "upgrade":
-        if not run_command("alembic upgrade head", "Applying migrations"):
+        if not run_command(command_api.upgrade, cfg, "head", description="Applying migrations"):
             return
         print("✅ All migrations applied successfully!")
         
+    elif command == "upgrade-all":
+        database_urls = [u.strip() for u in os.getenv("DATABASE_URLS", "").split(",") if u.strip()]
+        if not database_urls:
+            print("❌ Error: DATABASE_URLS must list at least one database URL")
+            return
+        print(f"🔄 Upgrading {len(database_urls)} databases")
+        if not upgrade_all(database_urls):
+            sys.exit(1)
+        print("✅ All databases upgraded!")
+
     elif command == "downgrade":
-        if not run_command("alembic downgrade -1", "Rolling back last migration"):
+        if not run_command(command_api.downgrade, cfg, "-1", description="Rolling back last migration"):
             return
         print("✅ Last migration rolled back!")
         
     elif command == "revision":
-        # Pass through all arguments after 'revision', properly handling quotes
         if len(sys.argv) < 3:
             print("❌ Error: revision command requires a message")
             print("Usage: python scripts/migrate.py revision -m \"Your message\"")
             return
-        
-        # Use subprocess.run directly to avoid shell quoting issues
-        try:
-            cmd_parts = ["alembic", "revision"] + sys.argv[2:]
-            result = subprocess.run(cmd_parts, check=True, capture_output=True, text=True)
-            if result.stdout:
-                print(result.stdout)
-            print("✅ New migration created!")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error running alembic revision: {e}")
-            if e.stderr:
-                print(f"Error output: {e.stderr}")
-            return False
+
+        parser = argparse.ArgumentParser(prog="migrate.py revision")
+        parser.add_argument("-m", "--message", required=True)
+        parser.add_argument("--autogenerate", action="store_true")
+        args = parser.parse_args(sys.argv[2:])
+        if not run_command(command_api.revision, cfg, message=args.message, autogenerate=args.autogenerate):
+            return
+        print("✅ New migration created!")
         
     elif command == "history":
-        if not run_command("alembic history", "Showing migration history"):
+        if not run_command(command_api.history, cfg, description="Showing migration history"):
             return
-        
+
+    elif command == "heads":
+        heads = ScriptDirectory.from_config(cfg).get_heads()
+        for head in heads:
+            print(f"{head} (head)")
+        if len(heads) != 1:
+            print(f"❌ Expected exactly one migration head, found {len(heads)}")
+            sys.exit(1)
+        print("✅ Single migration head")
+
     elif command == "current":
-        if not run_command("alembic current", "Showing current migration version"):
+        if not run_command(command_api.current, cfg, description="Showing current migration version"):
             return
             
     elif command == "reset":
@@ -110,9 +164,9 @@ Examples:
             
         print("🔄 Resetting database...")
         # Drop all tables (this is a simplified approach)
-        if not run_command("alembic downgrade base", "Rolling back all migrations"):
+        if not run_command(command_api.downgrade, cfg, "base", description="Rolling back all migrations"):
             return
-        if not run_command("alembic upgrade head", "Reapplying all migrations"):
+        if not run_command(command_api.upgrade, cfg, "head", description="Reapplying all migrations"):
             return
         print("✅ Database reset complete!")
         
@@ -0,0 +1,22 @@
+"""Administrative endpoints"""
+from fastapi import APIRouter, HTTPException, Depends
+
+from ..models import User
+from ..core.auth_deps import require_permission
+from ..services.langgraph_service import get_langgraph_service
+
+router = APIRouter()
+
+
+@router.post("/admin/graphs/reload")
+async def reload_graphs(user: User = Depends(require_permission("admin"))):
+    """Reload aegra.json and clear cached graphs (e.g. after a deploy).
+
+    Requires the ``admin`` permission.
+    """
+    langgraph_service = get_langgraph_service()
+    try:
+        graphs = await langgraph_service.reload()
+    except Exception as e:
+        raise HTTPException(400, f"Failed to reload graphs: {str(e)}")
+    return {"status": "reloaded", "graphs": list(graphs)}
@@ -1,29 +1,108 @@
 """Assistant endpoints for Agent Protocol"""
+from functools import lru_cache
 from uuid import uuid4
-from datetime import datetime
 from typing import List
 from fastapi import APIRouter, HTTPException, Depends
-import uuid
-from sqlalchemy import select, update, delete
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from ..models import Assistant, AssistantCreate, AssistantList, AssistantSearchRequest, AssistantSearchResponse, AgentSchemas, User
 from ..services.langgraph_service import get_langgraph_service
 from ..core.auth_deps import get_current_user
-from ..core.orm import Assistant as AssistantORM, get_session
+from ..core.orm import Assistant as AssistantORM, get_session, get_readonly_connection
+from ..core.responses import JSONResponse
+from ..utils.ids import UUIDStr
 
 router = APIRouter()
 
 
-def to_pydantic(row: AssistantORM) -> Assistant:
-    """Convert SQLAlchemy ORM object to Pydantic model with proper type casting."""
-    row_dict = {c.name: getattr(row, c.name) for c in row.__table__.columns}
-    # Cast UUIDs to str so they match the Pydantic schema
-    if "assistant_id" in row_dict and row_dict["assistant_id"] is not None:
-        row_dict["assistant_id"] = str(row_dict["assistant_id"])
-    if "user_id" in row_dict and isinstance(row_dict["user_id"], uuid.UUID):
-        row_dict["user_id"] = str(row_dict["user_id"])
-    return Assistant.model_validate(row_dict)
+# Columns needed to build the Assistant response model, resolved once at import.
+# Identifier columns are UUID(as_uuid=False), so values already arrive as str.
+_ASSISTANT_COLUMNS = (
+    AssistantORM.assistant_id,
+    AssistantORM.name,
+    AssistantORM.description,
+    AssistantORM.config,
+    AssistantORM.graph_id,
+    AssistantORM.user_id,
+    AssistantORM.created_at,
+)
+_ASSISTANT_FIELDS = tuple(c.key for c in _ASSISTANT_COLUMNS)
+
+
+def _mapping_to_pydantic(mapping) -> Assistant:
+    """Build an Assistant from a Core row mapping (trusted DB output, no validation)."""
+    return Assistant.model_construct(**_mapping_to_dict(mapping))
+
+
+def _mapping_to_dict(mapping) -> dict:
+    """Project a Core row mapping onto the Assistant response fields."""
+    return {k: mapping[k] for k in _ASSISTANT_FIELDS}
+
+
+# Schemas returned by get_assistant_schemas; identical for every graph today,
+# so build and validate the model once at import.
+_STATIC_AGENT_SCHEMAS = AgentSchemas(
+    input_schema={
+        "type": "object",
+        "properties": {
+            "input": {"type": "string", "description": "User input message"}
+        },
+        "required": ["input"]
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "output": {"type": "string", "description": "Agent response"}
+        }
+    },
+    state_schema={"type": "object", "additionalProperties": True},
+    config_schema={
+        "type": "object",
+        "properties": {
+            "configurable": {
+                "type": "object",
+                "properties": {
+                    "thread_id": {"type": "string"},
+                    "user_id": {"type": "string"}
+                }
+            }
+        }
+    }
+)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@lru_cache(maxsize=8)
+def _search_statements(has_name: bool, has_description: bool, has_graph_id: bool):
+    """Build the (page, count) statements for one filter shape.
+
+    Filter values are bind parameters, so the 8 possible shapes are built
+    once and reuse SQLAlchemy's compiled-SQL cache and asyncpg's prepared
+    statements instead of rebuilding the expression tree per request.
+    """
+    preds = [AssistantORM.user_id == bindparam("user_id")]
+    if has_name:
+        preds.append(AssistantORM.name.ilike(bindparam("name"), escape="\\"))
+    if has_description:
+        preds.append(AssistantORM.description.ilike(bindparam("description"), escape="\\"))
+    if has_graph_id:
+        preds.append(AssistantORM.graph_id == bindparam("graph_id"))
+
+    page = (
+        select(*_ASSISTANT_COLUMNS, func.count().over().label("total"))
+        .where(*preds)
+        .order_by(AssistantORM.created_at.desc())
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
+    )
+    count = select(func.count()).select_from(AssistantORM).where(*preds)
+    return page, count
 
 
 @router.post("/assistants", response_model=Assistant)
@@ -49,7 +128,7 @@ async def create_assistant(
     
     # Validate graph can be loaded
     try:
-        graph = await langgraph_service.get_graph(graph_id)
+        await langgraph_service.get_graph(graph_id)
     except Exception as e:
         raise HTTPException(400, f"Failed to load graph: {str(e)}")
     
@@ -59,131 +138,129 @@ async def create_assistant(
     # Generate name if not provided
     name = request.name or f"Assistant for {graph_id}"
     
-    # Check if an assistant already exists for this user+graph pair
-    existing_stmt = select(AssistantORM).where(
-        AssistantORM.user_id == user.identity,
-        AssistantORM.graph_id == graph_id,
-    )
-    existing = await session.scalar(existing_stmt)
-    
-    if existing:
-        if request.if_exists == "do_nothing":
-            return to_pydantic(existing)
-        elif request.if_exists == "replace":
-            # Update existing assistant
-            existing.name = name
-            existing.description = request.description
-            existing.config = request.config or {}
-            existing.graph_id = graph_id
-            existing.updated_at = datetime.utcnow()
-            await session.commit()
-            return to_pydantic(existing)
-        else:  # error (default)
-            raise HTTPException(409, f"Assistant '{assistant_id}' already exists")
-    
-    # Create assistant record
-    assistant_orm = AssistantORM(
+    # Single-statement upsert on the (user_id, graph_id) unique index
+    config = request.config or {}
+    stmt = insert(AssistantORM).values(
         assistant_id=assistant_id,
         name=name,
         description=request.description,
-        config=request.config or {},
+        config=config,
         graph_id=graph_id,
         user_id=user.identity
     )
-    
-    session.add(assistant_orm)
+    if request.if_exists == "replace":
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "graph_id"],
+            set_={
+                "name": name,
+                "description": request.description,
+                "config": config,
+                "updated_at": func.now(),
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["user_id", "graph_id"])
+
+    row = (await session.execute(stmt.returning(*_ASSISTANT_COLUMNS))).first()
     await session.commit()
-    await session.refresh(assistant_orm)
-    
-    return to_pydantic(assistant_orm)
+
+    if row is not None:
+        return _mapping_to_pydantic(row._mapping)
+
+    # Conflict without update: an assistant already exists for this user+graph pair
+    if request.if_exists != "do_nothing":
+        raise HTTPException(409, f"Assistant '{assistant_id}' already exists")
+
+    existing = (await session.execute(
+        select(*_ASSISTANT_COLUMNS).where(
+            AssistantORM.user_id == user.identity,
+            AssistantORM.graph_id == graph_id,
+        )
+    )).first()
+    return _mapping_to_pydantic(existing._mapping)
 
 
 @router.get("/assistants", response_model=AssistantList)
 async def list_assistants(
     user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    conn: AsyncConnection = Depends(get_readonly_connection)
 ):
     """List user's assistants"""
     # Filter assistants by user
-    stmt = select(AssistantORM).where(AssistantORM.user_id == user.identity)
-    result = await session.scalars(stmt)
-    user_assistants = [to_pydantic(a) for a in result.all()]
-    
-    return AssistantList(
-        assistants=user_assistants,
-        total=len(user_assistants)
+    stmt = (
+        select(*_ASSISTANT_COLUMNS)
+        .where(AssistantORM.user_id == user.identity)
+        .order_by(AssistantORM.created_at.desc())
     )
+    result = await conn.execute(stmt)
+    user_assistants = [_mapping_to_dict(row._mapping) for row in result]
+
+    # Plain dicts straight to orjson; shape matches AssistantList
+    return JSONResponse({"assistants": user_assistants, "total": len(user_assistants)})
 
 
 @router.post("/assistants/search", response_model=AssistantSearchResponse)
 async def search_assistants(
     request: AssistantSearchRequest,
     user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    conn: AsyncConnection = Depends(get_readonly_connection)
 ):
     """Search assistants with filters"""
-    # Start with user's assistants
-    stmt = select(AssistantORM).where(AssistantORM.user_id == user.identity)
-    
-    # Apply filters
-    if request.name:
-        stmt = stmt.where(AssistantORM.name.ilike(f"%{request.name}%"))
-    
-    if request.description:
-        stmt = stmt.where(AssistantORM.description.ilike(f"%{request.description}%"))
-    
-    if request.graph_id:
-        stmt = stmt.where(AssistantORM.graph_id == request.graph_id)
-    
-    # Get total count before pagination
-    count_stmt = select(AssistantORM).where(AssistantORM.user_id == user.identity)
+    offset = request.offset or 0
+    limit = request.limit or 20
+
+    shape = (bool(request.name), bool(request.description), bool(request.graph_id))
+    page_stmt, count_stmt = _search_statements(*shape)
+    params = {"user_id": user.identity}
     if request.name:
-        count_stmt = count_stmt.where(AssistantORM.name.ilike(f"%{request.name}%"))
+        params["name"] = f"%{_escape_like(request.name)}%"
     if request.description:
-        count_stmt = count_stmt.where(AssistantORM.description.ilike(f"%{request.description}%"))
+        params["description"] = f"%{_escape_like(request.description)}%"
     if request.graph_id:
-        count_stmt = count_stmt.where(AssistantORM.graph_id == request.graph_id)
-    
-    total = len(await session.scalars(count_stmt).all())
-    
-    # Apply pagination
-    offset = request.offset or 0
-    limit = request.limit or 20
-    stmt = stmt.offset(offset).limit(limit)
-    
-    result = await session.scalars(stmt)
-    paginated_assistants = [to_pydantic(a) for a in result.all()]
-    
-    return AssistantSearchResponse(
-        assistants=paginated_assistants,
-        total=total,
-        limit=limit,
-        offset=offset
-    )
+        params["graph_id"] = request.graph_id
+
+    # One round-trip: the window count rides along with the page rows
+    rows = (await conn.execute(page_stmt, {**params, "offset": offset, "limit": limit})).all()
+
+    if rows:
+        total = rows[0].total
+    else:
+        # Page past the end yields no rows to carry the window count
+        total = await conn.scalar(count_stmt, params)
+
+    paginated_assistants = [_mapping_to_dict(row._mapping) for row in rows]
+
+    # Plain dicts straight to orjson; shape matches AssistantSearchResponse
+    return JSONResponse({
+        "assistants": paginated_assistants,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
 
 
 @router.get("/assistants/{assistant_id}", response_model=Assistant)
 async def get_assistant(
-    assistant_id: str, 
+    assistant_id: UUIDStr,
     user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    conn: AsyncConnection = Depends(get_readonly_connection)
 ):
     """Get assistant by ID"""
-    stmt = select(AssistantORM).where(
+    stmt = select(*_ASSISTANT_COLUMNS).where(
         AssistantORM.assistant_id == assistant_id,
         AssistantORM.user_id == user.identity
     )
-    assistant = await session.scalar(stmt)
+    row = (await conn.execute(stmt)).first()
     
-    if not assistant:
+    if not row:
         raise HTTPException(404, f"Assistant '{assistant_id}' not found")
     
-    return to_pydantic(assistant)
+    return _mapping_to_pydantic(row._mapping)
 
 
 @router.delete("/assistants/{assistant_id}")
 async def delete_assistant(
-    assistant_id: str, 
+    assistant_id: UUIDStr,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -204,58 +281,30 @@ async def delete_assistant(
 
 @router.get("/assistants/{assistant_id}/schemas", response_model=AgentSchemas)
 async def get_assistant_schemas(
-    assistant_id: str, 
+    assistant_id: UUIDStr,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """Get input, output, state and config schemas for an assistant"""
     
-    stmt = select(AssistantORM).where(
+    # Only graph_id is needed (NOT NULL, so None means not found)
+    stmt = select(AssistantORM.graph_id).where(
         AssistantORM.assistant_id == assistant_id,
         AssistantORM.user_id == user.identity
     )
-    assistant = await session.scalar(stmt)
+    graph_id = await session.scalar(stmt)
     
-    if not assistant:
+    if graph_id is None:
         raise HTTPException(404, f"Assistant '{assistant_id}' not found")
     
     # Get LangGraph service
     langgraph_service = get_langgraph_service()
     
     try:
-        graph = await langgraph_service.get_graph(assistant.graph_id)
-        
-        # Extract schemas from LangGraph definition
-        schemas = AgentSchemas(
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "input": {"type": "string", "description": "User input message"}
-                },
-                "required": ["input"]
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "output": {"type": "string", "description": "Agent response"}
-                }
-            },
-            state_schema={"type": "object", "additionalProperties": True},
-            config_schema={
-                "type": "object",
-                "properties": {
-                    "configurable": {
-                        "type": "object",
-                        "properties": {
-                            "thread_id": {"type": "string"},
-                            "user_id": {"type": "string"}
-                        }
-                    }
-                }
-            }
-        )
-        
-        return schemas
+        await langgraph_service.get_graph(graph_id)
+
+        # Loading the graph validates it; the schemas themselves are static
+        return _STATIC_AGENT_SCHEMAS
         
     except Exception as e:
         raise HTTPException(400, f"Failed to extract schemas: {str(e)}")
\ No newline at end of file
@@ -1,28 +1,33 @@
 """Run endpoints for Agent Protocol"""
 import asyncio
-from uuid import uuid4
-from datetime import datetime
+import os
+import weakref
 from typing import Dict, Optional
 from fastapi import APIRouter, HTTPException, Depends, Header, Query
 import logging
-from sqlalchemy import select, update, delete
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, select, insert, update, delete, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from ..core.orm import (
     Assistant as AssistantORM, 
     Thread as ThreadORM, 
     Run as RunORM,
     get_session, 
+    get_readonly_connection,
     _get_session_maker
 )
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from ..models import Run, RunCreate, RunList, RunStatus, User
 from ..core.auth_deps import get_current_user
 from ..core.sse import get_sse_headers, create_end_event
+from ..core.responses import JSONResponse
 from ..core.auth_ctx import with_auth_ctx
 from ..services.langgraph_service import get_langgraph_service, create_run_config
 from ..services.streaming_service import streaming_service
+from ..services.event_store import event_store
 from ..utils.assistants import resolve_assistant_id
+from ..utils.ids import UUIDStr, canonical_uuid, uuid7
 
 router = APIRouter()
 
@@ -32,111 +37,241 @@ logger = logging.getLogger(__name__)
 
 # NOTE: We keep only an in-memory task registry for asyncio.Task handles.
 # All run metadata/state is persisted via ORM.
-active_runs: Dict[str, asyncio.Task] = {}
+# Weak lookup by run_id: finished tasks drop out once nothing references them.
+active_runs: "weakref.WeakValueDictionary[str, asyncio.Task]" = weakref.WeakValueDictionary()
+# Strong refs for pending tasks; the event loop itself only keeps weak ones.
+_background_tasks: set[asyncio.Task] = set()
+# Soft cap: past this many in-flight run tasks we log, since runs are queuing
+# on the semaphore faster than they finish
+ACTIVE_RUNS_WARN_THRESHOLD = int(os.getenv("ACTIVE_RUNS_WARN_THRESHOLD", "10000"))
+# Set while above the threshold so the warning fires once per crossing
+_active_runs_over_threshold = False
+
+# Shared SSE headers, resolved once; handlers add per-run Location headers
+_SSE_HEADERS = get_sse_headers()
+# Body returned when attaching to a run that has already finished
+_FINAL_END_FRAME = create_end_event().encode()
+
+# Hot run lookups, built once with bind parameters so each request reuses the
+# compiled SQL and asyncpg's prepared statement instead of a new expression tree
+_RUN_OWNER_FILTER = (
+    RunORM.thread_id == bindparam("thread_id"),
+    RunORM.user_id == bindparam("user_id"),
+)
+_OWNED_RUN_STMT = select(RunORM).where(RunORM.run_id == bindparam("run_id"), *_RUN_OWNER_FILTER)
+_RUN_ROW_STMT = select(*RunORM.__table__.c).where(RunORM.run_id == bindparam("run_id"), *_RUN_OWNER_FILTER)
+_RUN_PAGE_STMT = (
+    select(*RunORM.__table__.c, func.count().over().label("total"))
+    .where(*_RUN_OWNER_FILTER)
+    .order_by(RunORM.created_at.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_RUN_COUNT_STMT = select(func.count()).select_from(RunORM).where(*_RUN_OWNER_FILTER)
 
 # Default stream modes for background run execution
 RUN_STREAM_MODES = ["messages", "values", "custom"]
 
-async def set_thread_status(session: AsyncSession, thread_id: str, status: str):
+# Upper bound on graph executions running at once in this worker; runs over
+# the limit wait (still "pending") for a slot instead of piling onto the loop
+MAX_CONCURRENT_RUNS = int(os.getenv("MAX_CONCURRENT_RUNS", "64"))
+# Upper bound (seconds) a request may block waiting for a run to finish
+RUN_WAIT_TIMEOUT = float(os.getenv("RUN_WAIT_TIMEOUT", "30"))
+_run_semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+
+# Non-terminal status changes (e.g. "running") are coalesced and written in
+# one executemany; terminal ones are written immediately by update_run_status
+STATUS_FLUSH_INTERVAL = 0.02  # seconds
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled", "interrupted")
+# A failed flush is re-queued and retried this many times before it is dropped
+STATUS_FLUSH_MAX_ATTEMPTS = 3
+STATUS_FLUSH_RETRY_DELAY = 1.0  # seconds
+_pending_status_updates: Dict[str, str] = {}
+_status_flush_task: Optional[asyncio.Task] = None
+_status_flush_failures = 0
+
+
+def _normalize_stream_mode(mode):
+    """Map the client alias "messages-tuple" onto LangGraph's "messages" mode."""
+    return "messages" if mode == "messages-tuple" else mode
+
+
+def _sse_run_headers(thread_id: str, run_id: str) -> Dict[str, str]:
+    """SSE headers plus the Location pair pointing at the run and its stream."""
+    run_path = "/threads/" + thread_id + "/runs/" + run_id
+    return {**_SSE_HEADERS, "Location": run_path + "/stream", "Content-Location": run_path}
+
+
+def _register_run(run_id: str, task: asyncio.Task) -> None:
+    """Index a background run task and keep it alive until it finishes."""
+    global _active_runs_over_threshold
+    active_runs[run_id] = task
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    over = len(_background_tasks) > ACTIVE_RUNS_WARN_THRESHOLD
+    if over and not _active_runs_over_threshold:
+        logger.warning(
+            "%d run tasks in flight (threshold %d); runs are arriving faster than they finish",
+            len(_background_tasks),
+            ACTIVE_RUNS_WARN_THRESHOLD,
+        )
+    _active_runs_over_threshold = over
+
+
+def _cancel_local_task(run_id: str) -> bool:
+    """Cancel the run's task if it lives in this worker.
+
+    Returns True when a pending task was cancelled; its CancelledError handler
+    then signals the broker and persists the status. Callers fall back to
+    ``streaming_service.signal_run_cancelled`` when the run is not local and
+    persist the status themselves.
+    """
+    task = active_runs.get(run_id)
+    if task is None or task.done():
+        return False
+    task.cancel()
+    return True
+
+
+async def shutdown_runs(timeout: float = 10.0) -> None:
+    """Cancel every in-flight run task and wait for their cleanup to finish.
+
+    Works on a snapshot of the strong task set, so tasks finishing (and
+    leaving ``active_runs``) meanwhile cannot break the iteration.
+    """
+    tasks = [task for task in _background_tasks if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        # Let CancelledError handlers persist "cancelled" and signal brokers
+        await asyncio.wait(tasks, timeout=timeout)
+
+
+async def _wait_for_run_task(run_id: str, timeout: Optional[float] = RUN_WAIT_TIMEOUT) -> bool:
+    """Wait for a local run task to finish without ever cancelling it.
+
+    ``asyncio.wait`` neither cancels the task on timeout (unlike ``wait_for``)
+    nor forwards this request's cancellation on client disconnect (unlike a
+    bare ``await task``), and it swallows the task's own outcome. Returns
+    False only if the task was still running when the timeout expired.
+    """
+    task = active_runs.get(run_id)
+    if task is None:
+        return True
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    return bool(done)
+
+
+async def set_thread_status(session: AsyncSession, thread_id: str, status: str, commit: bool = True):
     """Update the status column of a thread."""
     await session.execute(
         update(ThreadORM)
         .where(ThreadORM.thread_id == thread_id)
-        .values(status=status, updated_at=datetime.utcnow())
+        .values(status=status, updated_at=func.now())
     )
-    await session.commit()
+    if commit:
+        await session.commit()
 
 
-async def update_thread_metadata(session: AsyncSession, thread_id: str, assistant_id: str, graph_id: str):
-    """Update thread metadata with assistant and graph information (dialect agnostic)."""
-    # Read-modify-write to avoid DB-specific JSON concat operators
-    thread = await session.scalar(
-        select(ThreadORM).where(ThreadORM.thread_id == thread_id)
-    )
-    if not thread:
-        raise HTTPException(404, f"Thread '{thread_id}' not found for metadata update")
-    md = dict(getattr(thread, "metadata_json", {}) or {})
-    md.update({
-        "assistant_id": str(assistant_id),
-        "graph_id": graph_id,
-    })
-    await session.execute(
+async def mark_thread_busy(session: AsyncSession, thread_id: str, assistant_id: str, graph_id: str) -> None:
+    """Mark a thread busy and record the assistant/graph in its metadata.
+
+    A single UPDATE merges the keys with jsonb ``||`` (instead of SELECT, then
+    two UPDATEs each with a commit). Not committed: it rides in the caller's
+    transaction together with the run INSERT.
+    """
+    md_patch = bindparam("md_patch", {"assistant_id": str(assistant_id), "graph_id": graph_id}, type_=JSONB)
+    updated = await session.scalar(
         update(ThreadORM)
         .where(ThreadORM.thread_id == thread_id)
-        .values(metadata_json=md, updated_at=datetime.utcnow())
+        .values(
+            status="busy",
+            metadata_json=func.coalesce(ThreadORM.metadata_json, text("'{}'::jsonb")).op("||")(md_patch),
+            updated_at=func.now(),
+        )
+        .returning(ThreadORM.thread_id)
+        .execution_options(synchronize_session=False)
     )
-    await session.commit()
+    if updated is None:
+        raise HTTPException(404, f"Thread '{thread_id}' not found for metadata update")
 
 
+def _resolve_run_assistant_id(requested_id: str, available_graphs) -> Optional[str]:
+    """Map a graph id or assistant UUID to a canonical assistant UUID.
 
-@router.post("/threads/{thread_id}/runs", response_model=Run)
-async def create_run(
+    Returns None when the value is neither, so callers answer 404 instead of
+    sending a malformed value to the uuid column.
+    """
+    try:
+        return canonical_uuid(resolve_assistant_id(str(requested_id), available_graphs))
+    except ValueError:
+        return None
+
+
+async def _create_and_schedule_run(
+    session: AsyncSession,
     thread_id: str,
     request: RunCreate,
-    user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
-):
-    """Create and execute a new run (persisted)."""
-
-    run_id = str(uuid4())
+    user: User,
+    status: str,
+) -> Run:
+    """Validate the assistant, persist a run row and schedule its execution.
 
-    # Get LangGraph service
-    langgraph_service = get_langgraph_service()
-    print(f"create_run: scheduling background task run_id={run_id} thread_id={thread_id} user={user.identity}")
-    print(f"[create_run] scheduling background task run_id={run_id} thread_id={thread_id} user={user.identity}")
+    Shared prologue of ``create_run`` and ``create_and_stream_run``; they only
+    differ in the initial status and in how the response is returned.
+    """
+    run_id = uuid7()
+    logger.debug("[create_run] scheduling background task run_id=%s thread_id=%s user=%s", run_id, thread_id, user.identity)
 
     # Validate assistant exists and get its graph_id. If a graph_id was provided
     # instead of an assistant UUID, map it deterministically and fall back to the
     # default assistant created at startup.
-    requested_id = str(request.assistant_id)
-    available_graphs = langgraph_service.list_graphs()
-    resolved_assistant_id = resolve_assistant_id(requested_id, available_graphs)
+    available_graphs = get_langgraph_service().list_graphs()
+    resolved_assistant_id = _resolve_run_assistant_id(request.assistant_id, available_graphs)
+    if resolved_assistant_id is None:
+        raise HTTPException(404, f"Assistant '{request.assistant_id}' not found")
 
-    assistant_stmt = select(AssistantORM).where(
-        AssistantORM.assistant_id == resolved_assistant_id,
+    # graph_id is the only column the run path needs (graph_id is NOT NULL,
+    # so None means no such assistant)
+    graph_id = await session.scalar(
+        select(AssistantORM.graph_id).where(AssistantORM.assistant_id == resolved_assistant_id)
     )
-    assistant = await session.scalar(assistant_stmt)
-    if not assistant:
+    if graph_id is None:
         raise HTTPException(404, f"Assistant '{request.assistant_id}' not found")
 
     # Validate the assistant's graph exists
-    available_graphs = langgraph_service.list_graphs()
-    if assistant.graph_id not in available_graphs:
-        raise HTTPException(404, f"Graph '{assistant.graph_id}' not found for assistant")
+    if graph_id not in available_graphs:
+        raise HTTPException(404, f"Graph '{graph_id}' not found for assistant")
 
     # Mark thread as busy and update metadata with assistant/graph info
-    await set_thread_status(session, thread_id, "busy")
-    await update_thread_metadata(session, thread_id, assistant.assistant_id, assistant.graph_id)
+    await mark_thread_busy(session, thread_id, resolved_assistant_id, graph_id)
 
     # Persist run record via ORM model in core.orm (Run table)
-    now = datetime.utcnow()
     run_orm = RunORM(
         run_id=run_id,  # explicitly set (DB can also default-generate if omitted)
         thread_id=thread_id,
         assistant_id=resolved_assistant_id,
-        status="pending",
+        status=status,
         input=request.input or {},
         config=request.config or {},
         user_id=user.identity,
-        created_at=now,
-        updated_at=now,
         output=None,
         error_message=None,
     )
     session.add(run_orm)
     await session.commit()
 
-    # Build response from ORM -> Pydantic
-    run = Run(
+    # Build response from ORM -> Pydantic (trusted values, skip validation)
+    run = Run.model_construct(
         run_id=run_id,
         thread_id=thread_id,
         assistant_id=resolved_assistant_id,
-        status="pending",
+        status=status,
         input=request.input or {},
         config=request.config or {},
         user_id=user.identity,
-        created_at=now,
-        updated_at=now,
+        created_at=run_orm.created_at,
+        updated_at=run_orm.updated_at,
         output=None,
         error_message=None,
     )
@@ -147,7 +282,7 @@ async def create_run(
         execute_run_async(
             run_id,
             thread_id,
-            assistant.graph_id,
+            graph_id,
             request.input or {},
             user,
             request.config,
@@ -156,104 +291,141 @@ async def create_run(
             request.checkpoint,
         )
     )
-    print(f"[create_run] background task created task_id={id(task)} for run_id={run_id}")
-    active_runs[run_id] = task
-
+    logger.debug("[create_run] background task created task_id=%s for run_id=%s", id(task), run_id)
+    _register_run(run_id, task)
     return run
 
 
-@router.post("/threads/{thread_id}/runs/stream")
-async def create_and_stream_run(
-    thread_id: str,
+async def _set_run_status_returning(session: AsyncSession, run_id: str, status: str) -> RunORM:
+    """Set a run's status and commit, returning the updated row from the same UPDATE."""
+    run_orm = (
+        await session.execute(
+            update(RunORM)
+            .where(RunORM.run_id == run_id)
+            .values(status=status, updated_at=func.now())
+            .returning(RunORM)
+        )
+    ).scalar_one()
+    await session.commit()
+    return run_orm
+
+
+async def get_owned_run(
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> RunORM:
+    """Dependency: load a run owned by the caller on the given thread, or 404.
+
+    FastAPI caches ``get_session``/``get_current_user`` per request, so the
+    handler that also depends on them receives the same session and the row
+    stays attached to it.
+    """
+    run_orm = await session.scalar(
+        _OWNED_RUN_STMT,
+        {"run_id": run_id, "thread_id": thread_id, "user_id": user.identity},
+    )
+    if not run_orm:
+        raise HTTPException(404, f"Run '{run_id}' not found")
+    return run_orm
+
+
+@router.post("/threads/{thread_id}/runs", response_model=Run)
+async def create_run(
+    thread_id: UUIDStr,
     request: RunCreate,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
-    """Create a new run and stream its execution - persisted + SSE."""
-    run_id = str(uuid4())
-
-    # Get LangGraph service
-    langgraph_service = get_langgraph_service()
-    print(f"[create_and_stream_run] scheduling background task run_id={run_id} thread_id={thread_id} user={user.identity}")
-
-    # Validate assistant exists and get its graph_id. Allow passing a graph_id
-    # by mapping it to a deterministic assistant ID.
-    requested_id = str(request.assistant_id)
-    available_graphs = langgraph_service.list_graphs()
+    """Create and execute a new run (persisted)."""
+    return await _create_and_schedule_run(session, thread_id, request, user, "pending")
 
-    resolved_assistant_id = resolve_assistant_id(requested_id, available_graphs)
 
-    assistant_stmt = select(AssistantORM).where(
-        AssistantORM.assistant_id == resolved_assistant_id,
-    )
-    assistant = await session.scalar(assistant_stmt)
-    if not assistant:
-        raise HTTPException(404, f"Assistant '{request.assistant_id}' not found")
+@router.post("/threads/{thread_id}/runs/batch", response_model=RunList)
+async def create_runs_batch(
+    thread_id: UUIDStr,
+    requests: list[RunCreate],
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Create and execute several runs on a thread with one multi-row INSERT."""
+    if not requests:
+        raise HTTPException(422, "At least one run is required")
 
-    # Validate the assistant's graph exists
+    langgraph_service = get_langgraph_service()
     available_graphs = langgraph_service.list_graphs()
-    if assistant.graph_id not in available_graphs:
-        raise HTTPException(404, f"Graph '{assistant.graph_id}' not found for assistant")
-
-    # Mark thread as busy and update metadata with assistant/graph info
-    await set_thread_status(session, thread_id, "busy")
-    await update_thread_metadata(session, thread_id, assistant.assistant_id, assistant.graph_id)
+    resolved_ids = [_resolve_run_assistant_id(r.assistant_id, available_graphs) for r in requests]
 
-    # Persist run record
-    now = datetime.utcnow()
-    run_orm = RunORM(
-        run_id=run_id,
-        thread_id=thread_id,
-        assistant_id=resolved_assistant_id,
-        status="streaming",
-        input=request.input or {},
-        config=request.config or {},
-        user_id=user.identity,
-        created_at=now,
-        updated_at=now,
-        output=None,
-        error_message=None,
+    # One lookup for every distinct assistant in the batch; unresolvable ids
+    # stay None and fail the not-found check below
+    assistant_rows = await session.execute(
+        select(AssistantORM.assistant_id, AssistantORM.graph_id).where(
+            AssistantORM.assistant_id.in_({rid for rid in resolved_ids if rid is not None})
+        )
     )
-    session.add(run_orm)
-    await session.commit()
-
-    # Build response model for stream context
-    run = Run(
-        run_id=run_id,
-        thread_id=thread_id,
-        assistant_id=resolved_assistant_id,
-        status="streaming",
-        input=request.input or {},
-        config=request.config or {},
-        user_id=user.identity,
-        created_at=now,
-        updated_at=now,
-        output=None,
-        error_message=None,
+    graph_by_assistant = {row.assistant_id: row.graph_id for row in assistant_rows}
+    for req, resolved_id in zip(requests, resolved_ids):
+        graph_id = graph_by_assistant.get(resolved_id)
+        if graph_id is None:
+            raise HTTPException(404, f"Assistant '{req.assistant_id}' not found")
+        if graph_id not in available_graphs:
+            raise HTTPException(404, f"Graph '{graph_id}' not found for assistant")
+
+    # Thread metadata records the last assistant in the batch, as sequential creates would
+    last_assistant_id = resolved_ids[-1]
+    await mark_thread_busy(session, thread_id, last_assistant_id, graph_by_assistant[last_assistant_id])
+
+    rows_to_create = [
+        {
+            "run_id": uuid7(),
+            "thread_id": thread_id,
+            "assistant_id": resolved_id,
+            "status": "pending",
+            "input": req.input or {},
+            "config": req.config or {},
+            "user_id": user.identity,
+        }
+        for req, resolved_id in zip(requests, resolved_ids)
+    ]
+    # executemany + RETURNING: SQLAlchemy batches this into multi-row INSERTs
+    result = await session.execute(
+        insert(RunORM).returning(*RunORM.__table__.c, sort_by_parameter_order=True),
+        rows_to_create,
     )
+    runs = [dict(row._mapping) for row in result]
+    await session.commit()
 
-    # Start background execution that will populate the broker
-    # Don't pass the session to avoid transaction conflicts
-    task = asyncio.create_task(
-        execute_run_async(
-            run_id,
-            thread_id,
-            assistant.graph_id,
-            request.input or {},
-            user,
-            request.config,
-            request.stream_mode,
-            None,  # Don't pass session to avoid conflicts
-            request.checkpoint,
+    for req, run in zip(requests, runs):
+        task = asyncio.create_task(
+            execute_run_async(
+                run["run_id"],
+                thread_id,
+                graph_by_assistant[run["assistant_id"]],
+                req.input or {},
+                user,
+                req.config,
+                req.stream_mode,
+                None,  # Don't pass session to avoid conflicts
+                req.checkpoint,
+            )
         )
-    )
-    print(f"[create_and_stream_run] background task created task_id={id(task)} for run_id={run_id}")
-    active_runs[run_id] = task
+        _register_run(run["run_id"], task)
+    logger.debug("[create_runs_batch] scheduled %s runs thread_id=%s user=%s", len(runs), thread_id, user.identity)
+
+    return {"runs": runs, "total": len(runs)}
+
 
-    # Extract requested stream mode(s)
-    stream_mode = request.stream_mode
-    if not stream_mode and request.config and "stream_mode" in request.config:
-        stream_mode = request.config["stream_mode"]
+@router.post("/threads/{thread_id}/runs/stream")
+async def create_and_stream_run(
+    thread_id: UUIDStr,
+    request: RunCreate,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Create a new run and stream its execution - persisted + SSE."""
+    run = await _create_and_schedule_run(session, thread_id, request, user, "streaming")
+    run_id = run.run_id
 
     # Stream immediately from broker (which will also include replay of any early events)
     cancel_on_disconnect = (request.on_disconnect or "continue").lower() == "cancel"
@@ -265,204 +437,153 @@ async def create_and_stream_run(
             cancel_on_disconnect=cancel_on_disconnect,
         ),
         media_type="text/event-stream",
-        headers={
-            **get_sse_headers(),
-            "Location": f"/threads/{thread_id}/runs/{run_id}/stream",
-            "Content-Location": f"/threads/{thread_id}/runs/{run_id}",
-        }
+        headers=_sse_run_headers(thread_id, run_id),
     )
 
 
 @router.get("/threads/{thread_id}/runs/{run_id}", response_model=Run)
 async def get_run(
-    thread_id: str,
-    run_id: str,
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
     user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    conn: AsyncConnection = Depends(get_readonly_connection),
 ):
     """Get run by ID (persisted)."""
-    stmt = select(RunORM).where(
-        RunORM.run_id == str(run_id),
-        RunORM.thread_id == thread_id,
-        RunORM.user_id == user.identity,
-    )
-    print(f"[get_run] querying DB run_id={run_id} thread_id={thread_id} user={user.identity}")
-    run_orm = await session.scalar(stmt)
-    if not run_orm:
+    logger.debug("[get_run] querying DB run_id=%s thread_id=%s user=%s", run_id, thread_id, user.identity)
+    row = (await conn.execute(
+        _RUN_ROW_STMT,
+        {"run_id": run_id, "thread_id": thread_id, "user_id": user.identity},
+    )).first()
+    if not row:
         raise HTTPException(404, f"Run '{run_id}' not found")
 
-    print(f"[get_run] found run status={run_orm.status} user={user.identity} thread_id={thread_id} run_id={run_id}")
-    # Convert to Pydantic
-    return Run.model_validate({c.name: getattr(run_orm, c.name) for c in run_orm.__table__.columns})
+    logger.debug("[get_run] found run status=%s user=%s thread_id=%s run_id=%s", row.status, user.identity, thread_id, run_id)
+    # Plain dict straight to orjson; shape matches Run
+    return JSONResponse(dict(row._mapping))
 
 
 @router.get("/threads/{thread_id}/runs", response_model=RunList)
 async def list_runs(
-    thread_id: str,
+    thread_id: UUIDStr,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum runs to return"),
+    offset: int = Query(0, ge=0, description="Runs to skip"),
     user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    conn: AsyncConnection = Depends(get_readonly_connection),
 ):
-    """List runs for a specific thread (persisted)."""
-    stmt = select(RunORM).where(
-        RunORM.thread_id == thread_id,
-        RunORM.user_id == user.identity,
-    ).order_by(RunORM.created_at.desc())
-    print(f"[list_runs] querying DB thread_id={thread_id} user={user.identity}")
-    result = await session.scalars(stmt)
-    rows = result.all()
-    runs = [Run.model_validate({c.name: getattr(r, c.name) for c in r.__table__.columns}) for r in rows]
-    print(f"[list_runs] total={len(runs)} user={user.identity} thread_id={thread_id}")
-    return RunList(runs=runs, total=len(runs))
+    """List runs for a specific thread (persisted), newest first."""
+    # Core select: Run response fields map 1:1 onto the runs columns.
+    # idx_runs_thread_created serves the filter + order as one range scan, so a
+    # page costs O(limit + offset) rows; the window count supplies the total.
+    # A NULL limit binds as LIMIT NULL, which Postgres treats as no limit.
+    params = {"thread_id": thread_id, "user_id": user.identity}
+    logger.debug("[list_runs] querying DB thread_id=%s user=%s", thread_id, user.identity)
+    rows = (await conn.execute(_RUN_PAGE_STMT, {**params, "offset": offset, "limit": limit})).all()
+    total = rows[0].total if rows else 0
+    if not rows and offset:
+        # Page past the end carries no window count
+        total = await conn.scalar(_RUN_COUNT_STMT, params)
+    runs = [{k: v for k, v in row._mapping.items() if k != "total"} for row in rows]
+    logger.debug("[list_runs] total=%s user=%s thread_id=%s", total, user.identity, thread_id)
+    # Plain dicts straight to orjson; shape matches RunList
+    return JSONResponse({"runs": runs, "total": total})
 
 
 @router.patch("/threads/{thread_id}/runs/{run_id}")
 async def update_run(
-    thread_id: str,
-    run_id: str,
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
     request: RunStatus,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    run_orm: RunORM = Depends(get_owned_run),
 ):
     """Update run status (for cancellation/interruption, persisted)."""
-    print(f"[update_run] fetch for update run_id={run_id} thread_id={thread_id} user={user.identity}")
-    run_orm = await session.scalar(
-        select(RunORM).where(
-            RunORM.run_id == str(run_id),
-            RunORM.thread_id == thread_id,
-            RunORM.user_id == user.identity,
-        )
-    )
-    if not run_orm:
-        raise HTTPException(404, f"Run '{run_id}' not found")
-
     # Handle interruption/cancellation
 
     if request.status == "cancelled":
-        print(f"[update_run] cancelling run_id={run_id} user={user.identity} thread_id={thread_id}")
-        await streaming_service.cancel_run(run_id)
-        print(f"[update_run] set DB status=cancelled run_id={run_id}")
-        await session.execute(
-            update(RunORM).where(RunORM.run_id == str(run_id)).values(status="cancelled", updated_at=datetime.utcnow())
-        )
-        await session.commit()
-        print(f"[update_run] commit done (cancelled) run_id={run_id}")
+        logger.debug("[update_run] cancelling run_id=%s user=%s thread_id=%s", run_id, user.identity, thread_id)
+        if not _cancel_local_task(run_id):
+            await streaming_service.signal_run_cancelled(run_id)
+        logger.debug("[update_run] set DB status=cancelled run_id=%s", run_id)
+        run_orm = await _set_run_status_returning(session, run_id, "cancelled")
+        logger.debug("[update_run] commit done (cancelled) run_id=%s", run_id)
     elif request.status == "interrupted":
-        print(f"[update_run] interrupt run_id={run_id} user={user.identity} thread_id={thread_id}")
-        await streaming_service.interrupt_run(run_id)
-        print(f"[update_run] set DB status=interrupted run_id={run_id}")
-        await session.execute(
-            update(RunORM).where(RunORM.run_id == str(run_id)).values(status="interrupted", updated_at=datetime.utcnow())
-        )
-        await session.commit()
-        print(f"[update_run] commit done (interrupted) run_id={run_id}")
+        logger.debug("[update_run] interrupt run_id=%s user=%s thread_id=%s", run_id, user.identity, thread_id)
+        await streaming_service.signal_run_error(run_id, "Run was interrupted")
+        logger.debug("[update_run] set DB status=interrupted run_id=%s", run_id)
+        run_orm = await _set_run_status_returning(session, run_id, "interrupted")
+        logger.debug("[update_run] commit done (interrupted) run_id=%s", run_id)
 
-    # Return final run state
-    run_orm = await session.scalar(select(RunORM).where(RunORM.run_id == run_id))
-    return Run.model_validate({c.name: getattr(run_orm, c.name) for c in run_orm.__table__.columns})
+    # Final run state: the RETURNING row, or the row loaded by get_owned_run
+    return Run.model_validate(run_orm)
 
 
 @router.get("/threads/{thread_id}/runs/{run_id}/join")
 async def join_run(
-    thread_id: str,
-    run_id: str,
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    run_orm: RunORM = Depends(get_owned_run),
 ):
     """Join a run (wait for completion and return final output) - persisted."""
-    # Get run and validate it exists
-    run_orm = await session.scalar(
-        select(RunORM).where(
-            RunORM.run_id == str(run_id),
-            RunORM.thread_id == thread_id,
-            RunORM.user_id == user.identity,
-        )
-    )
-    if not run_orm:
-        raise HTTPException(404, f"Run '{run_id}' not found")
-
     # If already completed, return output immediately
     if run_orm.status in ["completed", "failed", "cancelled"]:
         return getattr(run_orm, "output", None) or {}
 
-    # Wait for background task to complete
-    task = active_runs.get(run_id)
-    if task:
-        try:
-            await asyncio.wait_for(task, timeout=30.0)
-        except asyncio.TimeoutError:
-            # Task is taking too long, but that's okay - we'll check DB status
-            pass
-        except asyncio.CancelledError:
-            # Task was cancelled, that's also okay
-            pass
-
-    # Return final output from database
-    run_orm = await session.scalar(select(RunORM).where(RunORM.run_id == run_id))
+    # Wait (bounded) for the background task to complete
+    if not await _wait_for_run_task(run_id):
+        raise HTTPException(504, f"Run '{run_id}' is still executing")
+
+    # Return final output from database; refresh the row already in the session
+    run_orm = await session.scalar(
+        select(RunORM).where(RunORM.run_id == run_id).execution_options(populate_existing=True)
+    )
     return getattr(run_orm, "output", None) or {}
 
 
 @router.get("/threads/{thread_id}/runs/{run_id}/stream")
 async def stream_run(
-    thread_id: str,
-    run_id: str,
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
     last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
     stream_mode: Optional[str] = Query(None),
     user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    run_orm: RunORM = Depends(get_owned_run),
 ):
     """Stream run execution with SSE and reconnection support - persisted metadata."""
-    print(f"[stream_run] fetch for stream run_id={run_id} thread_id={thread_id} user={user.identity}")
-    run_orm = await session.scalar(
-        select(RunORM).where(
-            RunORM.run_id == str(run_id),
-            RunORM.thread_id == thread_id,
-            RunORM.user_id == user.identity,
-        )
-    )
-    if not run_orm:
-        raise HTTPException(404, f"Run '{run_id}' not found")
-
-    print(f"[stream_run] status={run_orm.status} user={user.identity} thread_id={thread_id} run_id={run_id}")
+    logger.debug("[stream_run] status=%s user=%s thread_id=%s run_id=%s", run_orm.status, user.identity, thread_id, run_id)
     # If already terminal, emit a final end event
     if run_orm.status in ["completed", "failed", "cancelled"]:
-        async def generate_final():
-            yield create_end_event()
-
-        print(f"[stream_run] starting terminal stream run_id={run_id} status={run_orm.status}")
-        return StreamingResponse(
-            generate_final(),
+        # Constant one-frame body; no generator or per-call encoding needed
+        logger.debug("[stream_run] starting terminal stream run_id=%s status=%s", run_id, run_orm.status)
+        return Response(
+            _FINAL_END_FRAME,
             media_type="text/event-stream",
-            headers={
-                **get_sse_headers(),
-                "Location": f"/threads/{thread_id}/runs/{run_id}/stream",
-                "Content-Location": f"/threads/{thread_id}/runs/{run_id}",
-            }
+            headers=_sse_run_headers(thread_id, run_id),
         )
 
     # Stream active or pending runs via broker
 
     # Build a lightweight Pydantic Run from ORM for streaming context (IDs already strings)
-    run_model = Run.model_validate({c.name: getattr(run_orm, c.name) for c in run_orm.__table__.columns})
+    run_model = Run.model_validate(run_orm)
 
     return StreamingResponse(
         streaming_service.stream_run_execution(run_model, last_event_id, cancel_on_disconnect=False),
         media_type="text/event-stream",
-        headers={
-            **get_sse_headers(),
-            "Location": f"/threads/{thread_id}/runs/{run_id}/stream",
-            "Content-Location": f"/threads/{thread_id}/runs/{run_id}",
-        }
+        headers=_sse_run_headers(thread_id, run_id),
     )
 
 
 @router.post("/threads/{thread_id}/runs/{run_id}/cancel")
 async def cancel_run_endpoint(
-    thread_id: str,
-    run_id: str,
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
     wait: int = Query(0, ge=0, le=1, description="Whether to wait for the run task to settle"),
     action: str = Query("cancel", pattern="^(cancel|interrupt)$", description="Cancellation action"),
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    run_orm: RunORM = Depends(get_owned_run),
 ):
     """
     Cancel or interrupt a run (client-compatible endpoint).
@@ -474,57 +595,32 @@ async def cancel_run_endpoint(
     - action=interrupt => cooperative interrupt if supported
     - wait=1 => await background task to finish settling
     """
-    print(f"[cancel_run] fetch run run_id={run_id} thread_id={thread_id} user={user.identity}")
-    run_orm = await session.scalar(
-        select(RunORM).where(
-            RunORM.run_id == run_id,
-            RunORM.thread_id == thread_id,
-            RunORM.user_id == user.identity,
-        )
-    )
-    if not run_orm:
-        raise HTTPException(404, f"Run '{run_id}' not found")
-
-
     if action == "interrupt":
-        print(f"[cancel_run] interrupt run_id={run_id} user={user.identity} thread_id={thread_id}")
-        await streaming_service.interrupt_run(run_id)
+        logger.debug("[cancel_run] interrupt run_id=%s user=%s thread_id=%s", run_id, user.identity, thread_id)
+        await streaming_service.signal_run_error(run_id, "Run was interrupted")
         # Persist status as interrupted
-        await session.execute(
-            update(RunORM).where(RunORM.run_id == str(run_id)).values(status="interrupted", updated_at=datetime.utcnow())
-        )
-        await session.commit()
+        run_orm = await _set_run_status_returning(session, run_id, "interrupted")
     else:
-        print(f"[cancel_run] cancel run_id={run_id} user={user.identity} thread_id={thread_id}")
-        await streaming_service.cancel_run(run_id)
+        logger.debug("[cancel_run] cancel run_id=%s user=%s thread_id=%s", run_id, user.identity, thread_id)
+        if not _cancel_local_task(run_id):
+            await streaming_service.signal_run_cancelled(run_id)
         # Persist status as cancelled
-        await session.execute(
-            update(RunORM).where(RunORM.run_id == str(run_id)).values(status="cancelled", updated_at=datetime.utcnow())
-        )
-        await session.commit()
+        run_orm = await _set_run_status_returning(session, run_id, "cancelled")
 
     # Optionally wait for background task
     if wait:
-        task = active_runs.get(run_id)
-        if task:
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                pass
-
-    # Reload and return updated Run (do NOT delete here; deletion is a separate endpoint)
-    run_orm = await session.scalar(
-        select(RunORM).where(
-            RunORM.run_id == run_id,
-            RunORM.thread_id == thread_id,
-            RunORM.user_id == user.identity,
+        await _wait_for_run_task(run_id)
+
+        # The task records its own final status while settling; reload it
+        # (do NOT delete here; deletion is a separate endpoint)
+        run_orm = await session.scalar(
+            select(RunORM)
+            .where(RunORM.run_id == run_id)
+            .execution_options(populate_existing=True)
         )
-    )
-    if not run_orm:
-        raise HTTPException(404, f"Run '{run_id}' not found after cancellation")
-    return Run.model_validate({c.name: getattr(run_orm, c.name) for c in run_orm.__table__.columns})
+        if not run_orm:
+            raise HTTPException(404, f"Run '{run_id}' not found after cancellation")
+    return Run.model_validate(run_orm)
 
 
 async def execute_run_async(
@@ -544,17 +640,22 @@ async def execute_run_async(
         maker = _get_session_maker()
         session = maker()
     # Normalize stream_mode once here for all callers/endpoints.
-    # Accept "messages-tuple" as an alias of "messages".
-    def _normalize_mode(mode):
-        return "messages" if isinstance(mode, str) and mode == "messages-tuple" else mode
-    if isinstance(stream_mode, list):
-        stream_mode = [_normalize_mode(m) for m in stream_mode]
+    # Accept "messages-tuple" as an alias of "messages"; no mode falls back
+    # to the shared default list.
+    if not stream_mode:
+        stream_mode = RUN_STREAM_MODES
+    elif isinstance(stream_mode, list):
+        stream_mode = [_normalize_stream_mode(m) for m in stream_mode]
     else:
-        stream_mode = _normalize_mode(stream_mode)
+        stream_mode = _normalize_stream_mode(stream_mode)
     
+    acquired = False
     try:
-        # Update status
-        await update_run_status(run_id, "running", session=session)
+        await _run_semaphore.acquire()
+        acquired = True
+
+        # Update status (coalesced with other runs starting around now)
+        queue_run_status(run_id, "running")
         
         # Get graph and execute
         langgraph_service = get_langgraph_service()
@@ -564,65 +665,128 @@ async def execute_run_async(
         
         # Always execute using streaming to capture events for later replay
         event_counter = 0
-        final_output = None
+        event_id_prefix = f"{run_id}_event_"
+        # Bound once: the loop below runs per token for message streams
+        publish = streaming_service.publish
         # Use streaming service's broker system to distribute events
         async with with_auth_ctx(user, []):
             async for raw_event in graph.astream(
                 input_data,
                 config=run_config,
-                stream_mode=stream_mode or RUN_STREAM_MODES,
+                stream_mode=stream_mode,
             ):
                 event_counter += 1
-                event_id = f"{run_id}_event_{event_counter}"
-                # Forward to broker for live consumers
-                await streaming_service.put_to_broker(run_id, event_id, raw_event)
-                # Store for replay
-                await streaming_service.store_event_from_raw(run_id, event_id, raw_event)
-                # Track final output
-                if isinstance(raw_event, tuple):
-                    if len(raw_event) >= 2 and raw_event[0] == "values":
-                        final_output = raw_event[1]
-                elif not isinstance(raw_event, tuple):
-                    # Non-tuple events are values mode
-                    final_output = raw_event
+                event_id = event_id_prefix + str(event_counter)
+                # Forward to live consumers and store for replay
+                await publish(run_id, event_id, raw_event)
 
         # Signal end of stream
         event_counter += 1
-        end_event_id = f"{run_id}_event_{event_counter}"
-        end_event = ("end", {"status": "completed", "final_output": final_output})
+        end_event_id = event_id_prefix + str(event_counter)
+        # The final state is already persisted as the last "values" event and
+        # in the checkpointer, so the end marker carries only the status
+        end_event = ("end", {"status": "completed"})
         
-        await streaming_service.put_to_broker(run_id, end_event_id, end_event)
-        await streaming_service.store_event_from_raw(run_id, end_event_id, end_event)
+        await publish(run_id, end_event_id, end_event)
+        # Events are persisted in batches; make the tail durable before the
+        # terminal status tells replaying clients the stream is complete
+        await event_store.flush()
         
         # Update with results (store empty JSON to avoid serialization issues for now)
-        await update_run_status(run_id, "completed", output={}, session=session)
-        # Mark thread back to idle
-        if not session:
-            raise RuntimeError(f"No database session available to update thread {thread_id} status")
+        # and mark thread back to idle in the same transaction
+        await update_run_status(run_id, "completed", output={}, session=session, commit=False)
         await set_thread_status(session, thread_id, "idle")
         
     except asyncio.CancelledError:
         # Store empty output to avoid JSON serialization issues
-        await update_run_status(run_id, "cancelled", output={}, session=session)
-        if not session:
-            raise RuntimeError(f"No database session available to update thread {thread_id} status")
+        await update_run_status(run_id, "cancelled", output={}, session=session, commit=False)
         await set_thread_status(session, thread_id, "idle")
         # Signal cancellation to broker
         await streaming_service.signal_run_cancelled(run_id)
         raise
     except Exception as e:
         # Store empty output to avoid JSON serialization issues
-        await update_run_status(run_id, "failed", output={}, error=str(e), session=session)
-        if not session:
-            raise RuntimeError(f"No database session available to update thread {thread_id} status")
+        await update_run_status(run_id, "failed", output={}, error=str(e), session=session, commit=False)
         await set_thread_status(session, thread_id, "idle")
         # Signal error to broker
         await streaming_service.signal_run_error(run_id, str(e))
         raise
     finally:
+        if acquired:
+            _run_semaphore.release()
+        # Persist whatever the cancel/error paths left in the event buffer
+        await event_store.flush()
         # Clean up broker
         await streaming_service.cleanup_run(run_id)
-        active_runs.pop(run_id, None)
+
+
+def queue_run_status(run_id: str, status: str) -> None:
+    """Buffer a non-terminal status change for the next batched flush."""
+    _pending_status_updates[run_id] = status
+    _schedule_status_flush(STATUS_FLUSH_INTERVAL)
+
+
+def _schedule_status_flush(delay: float) -> None:
+    global _status_flush_task
+    current = asyncio.current_task()
+    if _status_flush_task is None or _status_flush_task.done() or _status_flush_task is current:
+        _status_flush_task = asyncio.create_task(_flush_status_after_interval(delay))
+
+
+async def _flush_status_after_interval(delay: float) -> None:
+    await asyncio.sleep(delay)
+    await flush_run_status_updates()
+
+
+async def flush_run_status_updates() -> None:
+    """Write all buffered status changes with a single executemany UPDATE.
+
+    A failed batch is put back and retried after ``STATUS_FLUSH_RETRY_DELAY``;
+    it is dropped, with an error logged, after ``STATUS_FLUSH_MAX_ATTEMPTS``
+    consecutive failures.
+    """
+    global _status_flush_failures
+    if not _pending_status_updates:
+        return
+    pending = dict(_pending_status_updates)
+    _pending_status_updates.clear()
+    batch = [{"b_run_id": rid, "b_status": st} for rid, st in pending.items()]
+    runs_table = RunORM.__table__
+    stmt = (
+        update(runs_table)
+        .where(
+            runs_table.c.run_id == bindparam("b_run_id"),
+            # Never let a late buffered write clobber a terminal status
+            runs_table.c.status.not_in(_TERMINAL_STATUSES),
+        )
+        .values(status=bindparam("b_status"), updated_at=func.now())
+    )
+    maker = _get_session_maker()
+    try:
+        async with maker() as session:
+            await session.execute(stmt, batch)
+            await session.commit()
+    except Exception:
+        _status_flush_failures += 1
+        if _status_flush_failures >= STATUS_FLUSH_MAX_ATTEMPTS:
+            logger.exception(
+                "Dropping %d run status updates after %d failed flush attempts",
+                len(batch), _status_flush_failures,
+            )
+            _status_flush_failures = 0
+            return
+        logger.warning(
+            "Failed to flush %d run status updates (attempt %d/%d), retrying",
+            len(batch), _status_flush_failures, STATUS_FLUSH_MAX_ATTEMPTS,
+            exc_info=True,
+        )
+        # Keep any status queued meanwhile; the terminal guard in the UPDATE
+        # covers runs that finished with a direct write since
+        for rid, st in pending.items():
+            _pending_status_updates.setdefault(rid, st)
+        _schedule_status_flush(STATUS_FLUSH_RETRY_DELAY)
+    else:
+        _status_flush_failures = 0
 
 
 async def update_run_status(
@@ -631,23 +795,31 @@ async def update_run_status(
     output=None,
     error: str = None,
     session: Optional[AsyncSession] = None,
+    commit: bool = True,
 ):
-    """Update run status in database (persisted). If session not provided, opens a short-lived session."""
+    """Update run status in database (persisted). If session not provided, opens a short-lived session.
+
+    Pass ``commit=False`` with a caller-owned session to fold this UPDATE into
+    the caller's transaction (e.g. together with the thread status change).
+    """
+    # A direct write supersedes any buffered change for this run
+    _pending_status_updates.pop(run_id, None)
     owns_session = False
     if session is None:
         maker = _get_session_maker()
         session = maker()  # type: ignore[assignment]
         owns_session = True
     try:
-        values = {"status": status, "updated_at": datetime.utcnow()}
+        values = {"status": status, "updated_at": func.now()}
         if output is not None:
             values["output"] = output
         if error is not None:
             values["error_message"] = error
-        print(f"[update_run_status] updating DB run_id={run_id} status={status}")
+        logger.debug("[update_run_status] updating DB run_id=%s status=%s", run_id, status)
         await session.execute(update(RunORM).where(RunORM.run_id == str(run_id)).values(**values))  # type: ignore[arg-type]
-        await session.commit()
-        print(f"[update_run_status] commit done run_id={run_id}")
+        if commit or owns_session:
+            await session.commit()
+            logger.debug("[update_run_status] commit done run_id=%s", run_id)
     finally:
         # Close only if we created it here
         if owns_session:
@@ -656,11 +828,12 @@ async def update_run_status(
 
 @router.delete("/threads/{thread_id}/runs/{run_id}", status_code=204)
 async def delete_run(
-    thread_id: str,
-    run_id: str,
+    thread_id: UUIDStr,
+    run_id: UUIDStr,
     force: int = Query(0, ge=0, le=1, description="Force cancel active run before delete (1=yes)"),
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    run_orm: RunORM = Depends(get_owned_run),
 ):
     """
     Delete a run record.
@@ -670,17 +843,6 @@ async def delete_run(
     - If force=1 and the run is active, cancels it first (best-effort) and then deletes.
     - Always returns 204 No Content on successful deletion.
     """
-    print(f"[delete_run] fetch run run_id={run_id} thread_id={thread_id} user={user.identity}")
-    run_orm = await session.scalar(
-        select(RunORM).where(
-            RunORM.run_id == str(run_id),
-            RunORM.thread_id == thread_id,
-            RunORM.user_id == user.identity,
-        )
-    )
-    if not run_orm:
-        raise HTTPException(404, f"Run '{run_id}' not found")
-
     # If active and not forcing, reject deletion
     if run_orm.status in ["pending", "running", "streaming"] and not force:
         raise HTTPException(
@@ -690,17 +852,11 @@ async def delete_run(
 
     # If forcing and active, cancel first
     if force and run_orm.status in ["pending", "running", "streaming"]:
-        print(f"[delete_run] force-cancelling active run run_id={run_id}")
-        await streaming_service.cancel_run(run_id)
+        logger.debug("[delete_run] force-cancelling active run run_id=%s", run_id)
+        if not _cancel_local_task(run_id):
+            await streaming_service.signal_run_cancelled(run_id)
         # Best-effort: wait for bg task to settle
-        task = active_runs.get(run_id)
-        if task:
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                pass
+        await _wait_for_run_task(run_id)
 
     # Delete the record
     await session.execute(
@@ -712,10 +868,5 @@ async def delete_run(
     )
     await session.commit()
 
-    # Clean up active task if exists
-    task = active_runs.pop(run_id, None)
-    if task and not task.done():
-        task.cancel()
-
     # 204 No Content
     return
@@ -5,6 +5,7 @@ from ..models import StoreDeleteRequest
 
 from ..models import StorePutRequest, StoreGetResponse, StoreSearchRequest, StoreSearchResponse, StoreItem, User
 from ..core.auth_deps import get_current_user
+from ..core.database import db_manager
 
 router = APIRouter()
 
@@ -17,7 +18,6 @@ async def put_store_item(request: StorePutRequest, user: User = Depends(get_curr
     scoped_namespace = apply_user_namespace_scoping(user.identity, request.namespace)
     
     # Get LangGraph store from database manager
-    from ..core.database import db_manager
     store = await db_manager.get_store()
     
     await store.aput(
@@ -50,7 +50,6 @@ async def get_store_item(
     scoped_namespace = apply_user_namespace_scoping(user.identity, ns_list)
     
     # Get LangGraph store from database manager
-    from ..core.database import db_manager
     store = await db_manager.get_store()
     
     item = await store.aget(tuple(scoped_namespace), key)
@@ -91,7 +90,6 @@ async def delete_store_item(
     scoped_namespace = apply_user_namespace_scoping(user.identity, ns)
 
     # Get LangGraph store from database manager
-    from ..core.database import db_manager
     store = await db_manager.get_store()
 
     await store.adelete(tuple(scoped_namespace), k)
@@ -107,7 +105,6 @@ async def search_store_items(request: StoreSearchRequest, user: User = Depends(g
     scoped_prefix = apply_user_namespace_scoping(user.identity, request.namespace_prefix)
     
     # Get LangGraph store from database manager
-    from ..core.database import db_manager
     store = await db_manager.get_store()
     
     # Search with LangGraph store
@@ -1,6 +1,6 @@
 """Thread endpoints for Agent Protocol"""
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 import json
 import logging
@@ -13,6 +13,7 @@ from ..models import Thread, ThreadCreate, ThreadList, ThreadSearchRequest, Thre
 from ..core.auth_deps import get_current_user
 from ..core.orm import Thread as ThreadORM, get_session
 from ..core.database import db_manager
+from ..utils.ids import UUIDStr
 
 # TODO: adopt structured logging across all modules; replace print() and bare exceptions in:
 # - agent_server/api/*.py
@@ -90,7 +91,7 @@ async def create_thread(
     coerced_metadata = _coerce_dict(getattr(thread_orm, "metadata_json", metadata), metadata)
     coerced_created_at = getattr(thread_orm, "created_at", None)
     if not isinstance(coerced_created_at, datetime):
-        coerced_created_at = datetime.utcnow()
+        coerced_created_at = datetime.now(timezone.utc)
 
     thread_dict: Dict[str, Any] = {
         "thread_id": coerced_thread_id,
@@ -124,7 +125,7 @@ async def list_threads(
 
 @router.get("/threads/{thread_id}", response_model=Thread)
 async def get_thread(
-    thread_id: str,
+    thread_id: UUIDStr,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -141,7 +142,7 @@ async def get_thread(
 
 @router.post("/threads/{thread_id}/history", response_model=List[ThreadState])
 async def get_thread_history_post(
-    thread_id: str,
+    thread_id: UUIDStr,
     request: ThreadHistoryRequest,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
@@ -155,8 +156,8 @@ async def get_thread_history_post(
             raise HTTPException(422, "Invalid limit; must be an integer between 1 and 1000")
 
         before = request.before
-        if before is not None and not isinstance(before, str):
-            raise HTTPException(422, "Invalid 'before' parameter; must be a string checkpoint identifier")
+        if before is not None and not isinstance(before, (str, dict)):
+            raise HTTPException(422, "Invalid 'before' parameter; must be a checkpoint identifier or object")
 
         metadata = request.metadata
         if metadata is not None and not isinstance(metadata, dict):
@@ -210,11 +211,20 @@ async def get_thread_history_post(
         elif checkpoint_ns is not None:
             config["configurable"]["checkpoint_ns"] = checkpoint_ns
 
+        # Keyset pagination: the checkpointer turns `before` into
+        # `checkpoint_id < :before ORDER BY checkpoint_id DESC LIMIT :limit`,
+        # so each page is an index range scan rather than an OFFSET skip.
+        # Clients page by passing the last returned checkpoint_id back.
+        before_config = None
+        if before is not None:
+            before_cp = {"checkpoint_id": before} if isinstance(before, str) else before
+            before_config = {"configurable": {"thread_id": thread_id, **before_cp}}
+
         # Fetch state history
         state_snapshots = []
         kwargs = {
             "limit": limit,
-            "before": before,
+            "before": before_config,
         }
         # The runtime may expect metadata filter under "filter" or "metadata"; try "metadata"
         if metadata is not None:
@@ -284,7 +294,7 @@ async def get_thread_history_post(
 
 @router.get("/threads/{thread_id}/history", response_model=List[ThreadState])
 async def get_thread_history_get(
-    thread_id: str,
+    thread_id: UUIDStr,
     limit: int = Query(10, ge=1, le=1000, description="Number of states to return"),
     before: Optional[str] = Query(None, description="Return states before this checkpoint ID"),
     subgraphs: Optional[bool] = Query(False, description="Include states from subgraphs"),
@@ -318,7 +328,7 @@ async def get_thread_history_get(
 
 @router.delete("/threads/{thread_id}")
 async def delete_thread(
-    thread_id: str,
+    thread_id: UUIDStr,
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -347,9 +357,8 @@ async def search_threads(
         stmt = stmt.where(ThreadORM.status == request.status)
 
     if request.metadata:
-        # For each key/value, filter JSONB field
-        for key, value in request.metadata.items():
-            stmt = stmt.where(ThreadORM.metadata_json[key].as_string() == str(value))
+        # Single JSONB containment (@>) predicate so the GIN index can be used
+        stmt = stmt.where(ThreadORM.metadata_json.contains(request.metadata))
 
     # Count total first
     _count_result = await session.scalars(stmt)
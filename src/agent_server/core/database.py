@@ -1,4 +1,5 @@
 """Database manager with LangGraph integration"""
+import asyncio
 import os
 from typing import Optional
 
@@ -25,10 +26,21 @@ class DatabaseManager:
     async def initialize(self):
         """Initialize database connections and LangGraph components"""
         # SQLAlchemy for our minimal Agent Protocol metadata tables
+        pool_size = int(os.getenv("DATABASE_POOL_SIZE", "20"))
         self.engine = create_async_engine(
             self._database_url,
-            echo=os.getenv("DATABASE_ECHO", "false").lower() == "true"
+            echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
+            pool_size=pool_size,
+            max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "40")),
+            pool_pre_ping=False,
+            pool_recycle=3600,
+            # Keep parsed statements per connection so hot queries skip Parse
+            connect_args={
+                "statement_cache_size": 1024,
+                "prepared_statement_cache_size": 1024,
+            },
         )
+        await self._warm_pool(min(int(os.getenv("DATABASE_POOL_WARMUP", "5")), pool_size))
         
         # Convert asyncpg URL to psycopg format for LangGraph
         # LangGraph packages require psycopg format, not asyncpg
@@ -47,6 +59,24 @@ class DatabaseManager:
     
 
     
+    async def _warm_pool(self, count: int) -> None:
+        """Open ``count`` pooled connections up front.
+
+        The pool otherwise connects lazily, so the first requests after a
+        start would each pay the TCP/auth handshake. Best-effort: failures
+        are reported and left for the first real query to surface.
+        """
+        if count <= 0:
+            return
+        results = await asyncio.gather(
+            *(self.engine.connect() for _ in range(count)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"⚠️  Connection pool warm-up failed: {result}")
+            else:
+                await result.close()
+
     async def close(self):
         """Close database connections"""
         if self.engine:
@@ -96,6 +96,17 @@ async def health_check():
     return health_status
 
 
+@router.get("/health/migrations")
+async def migrations_check():
+    """Report the Alembic head revision versus the database's current revision"""
+    from .migrations import get_migration_status
+
+    try:
+        return await get_migration_status()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Migration status unavailable: {str(e)}")
+
+
 @router.get("/ready")
 async def readiness_check():
     """Kubernetes readiness probe endpoint"""
@@ -0,0 +1,68 @@
+"""Alembic migration runner used at application startup.
+
+``MIGRATION_MODE`` controls what the lifespan does:
+
+• ``skip`` (default) – migrations are applied out of band (``alembic upgrade head``).
+• ``sync`` – apply pending migrations before serving traffic.
+• ``async`` – start serving immediately and apply migrations in the background;
+  progress is reported by ``GET /health/migrations``.
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+MIGRATION_MODE = os.getenv("MIGRATION_MODE", "skip").lower()
+
+# Progress of the startup migration run: idle | running | completed | failed
+migration_state: Dict[str, Optional[str]] = {"status": "idle", "error": None}
+
+
+def _alembic_config() -> Config:
+    cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
+    cfg.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    # Keep the server's logging: env.py would otherwise apply alembic.ini's
+    # fileConfig, silencing uvicorn and app loggers and raising root to WARN
+    cfg.attributes["configure_logger"] = False
+    return cfg
+
+
+async def run_migrations() -> None:
+    """Upgrade the database to head without blocking the event loop."""
+    migration_state.update(status="running", error=None)
+    try:
+        # env.py drives its own event loop, so it must run off this one
+        await asyncio.to_thread(command.upgrade, _alembic_config(), "head")
+        migration_state["status"] = "completed"
+    except Exception as e:
+        migration_state.update(status="failed", error=str(e))
+        raise
+
+
+async def get_migration_status() -> Dict[str, Any]:
+    """Compare the Alembic script head with the revision stored in the database."""
+    from .database import db_manager
+
+    head = ScriptDirectory.from_config(_alembic_config()).get_current_head()
+    current = None
+    async with db_manager.get_engine().connect() as conn:
+        try:
+            current = await conn.scalar(text("SELECT version_num FROM alembic_version"))
+        except Exception:
+            # Table missing means no migration has ever been applied
+            current = None
+    return {
+        "mode": MIGRATION_MODE,
+        "status": migration_state["status"],
+        "error": migration_state["error"],
+        "head": head,
+        "current": current,
+        "up_to_date": head == current,
+    }
@@ -24,12 +24,14 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
     text,
     Index,
     Integer,
+    LargeBinary,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column
 
 
@@ -39,9 +41,9 @@ Base = declarative_base()
 class Assistant(Base):
     __tablename__ = "assistant"
 
-    # TEXT PK with DB-side generation using uuid_generate_v4()::text
+    # Native UUID PK with DB-side generation; values surface as str in Python
     assistant_id: Mapped[str] = mapped_column(
-        Text, primary_key=True, server_default=text("uuid_generate_v4()::text")
+        UUID(as_uuid=False), primary_key=True, server_default=text("uuid_generate_v4()")
     )
     name: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -52,21 +54,34 @@ class Assistant(Base):
         TIMESTAMP(timezone=True), server_default=text("now()")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("now()")
+        TIMESTAMP(timezone=True), server_default=text("now()"), onupdate=func.now()
     )
 
 
     # Indexes for performance
     __table_args__ = (
-        Index('idx_assistant_user', 'user_id'),
+        # Leading user_id column also serves user-only lookups
         Index('idx_assistant_user_graph', 'user_id', 'graph_id', unique=True),
+        # Trigram GIN indexes serving ILIKE '%term%' in assistant search
+        Index(
+            'idx_assistant_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_assistant_description_trgm',
+            'description',
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+        ),
     )
 
 
 class Thread(Base):
     __tablename__ = "thread"
 
-    thread_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    thread_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
     status: Mapped[str] = mapped_column(Text, server_default=text("'idle'"))
     # Database column is 'metadata_json' (per database.py). ORM attribute 'metadata_json' must map to that column.
     metadata_json: Mapped[dict] = mapped_column("metadata_json", JSONB, server_default=text("'{}'::jsonb"))
@@ -75,22 +90,31 @@ class Thread(Base):
         TIMESTAMP(timezone=True), server_default=text("now()")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("now()")
+        TIMESTAMP(timezone=True), server_default=text("now()"), onupdate=func.now()
     )
 
     # Indexes for performance
     __table_args__ = (
         Index('idx_thread_user', 'user_id'),
+        # GIN index serving metadata containment (@>) filters in thread search
+        Index(
+            'idx_thread_metadata_gin',
+            'metadata_json',
+            postgresql_using='gin',
+            postgresql_ops={'metadata_json': 'jsonb_path_ops'},
+        ),
     )
 
 
 class Run(Base):
     __tablename__ = "runs"
+    # Fetch server-side timestamps via INSERT ... RETURNING in the same round-trip
+    __mapper_args__ = {"eager_defaults": True}
 
-    # TEXT PK with DB-side generation using uuid_generate_v4()::text
-    run_id: Mapped[str] = mapped_column(Text, primary_key=True, server_default=text("uuid_generate_v4()::text"))
-    thread_id: Mapped[str] = mapped_column(Text, ForeignKey("thread.thread_id"), nullable=False)
-    assistant_id: Mapped[str | None] = mapped_column(Text, ForeignKey("assistant.assistant_id"))
+    # Native UUID PK with DB-side generation; values surface as str in Python
+    run_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, server_default=text("uuid_generate_v4()"))
+    thread_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("thread.thread_id"), nullable=False)
+    assistant_id: Mapped[str | None] = mapped_column(UUID(as_uuid=False), ForeignKey("assistant.assistant_id"))
     status: Mapped[str] = mapped_column(Text, server_default=text("'pending'"))
     input: Mapped[dict | None] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
     # Some environments may not yet have a 'config' column; make it nullable without default to match existing DB.
@@ -103,27 +127,42 @@ class Run(Base):
         TIMESTAMP(timezone=True), server_default=text("now()")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=text("now()")
+        TIMESTAMP(timezone=True), server_default=text("now()"), onupdate=func.now()
     )
 
     # Indexes for performance
     __table_args__ = (
-        Index('idx_runs_thread_id', 'thread_id'),
-        Index('idx_runs_user', 'user_id'),
+        Index('idx_runs_thread_created', 'thread_id', text('created_at DESC')),
+        Index('idx_runs_user_status', 'user_id', 'status'),
         Index('idx_runs_status', 'status'),
-        Index('idx_runs_assistant_id', 'assistant_id'),
-        Index('idx_runs_created_at', 'created_at'),
+        Index('idx_runs_assistant_status', 'assistant_id', 'status'),
+        # BRIN suits append-only created_at: tiny index, cheap to maintain
+        Index(
+            'idx_runs_created_at_brin',
+            'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        ),
+        # Partial index: only active runs, stays small as finished runs pile up
+        Index(
+            'idx_runs_active',
+            'status',
+            'created_at',
+            postgresql_where=text("status IN ('pending', 'running', 'streaming')"),
+        ),
     )
 
 
 class RunEvent(Base):
     __tablename__ = "run_events"
 
+    # Composite "<run_id>_event_<seq>" key, so this one stays TEXT
     id: Mapped[str] = mapped_column(Text, primary_key=True)
-    run_id: Mapped[str] = mapped_column(Text, nullable=False)
+    run_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
     seq: Mapped[int] = mapped_column(Integer, nullable=False)
     event: Mapped[str] = mapped_column(Text, nullable=False)
-    data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Pre-serialized UTF-8 JSON; replayed verbatim, never queried into
+    data: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=text("now()")
     )
@@ -157,3 +196,14 @@ async def get_session() -> AsyncIterator[AsyncSession]:
     maker = _get_session_maker()
     async with maker() as session:
         yield session
+
+
+async def get_readonly_connection() -> AsyncIterator[AsyncConnection]:
+    """FastAPI dependency that yields an AUTOCOMMIT connection for read-only endpoints.
+
+    Skips the ORM unit of work and the BEGIN/COMMIT round-trips; each Core
+    statement runs as its own implicit transaction.
+    """
+    from .database import db_manager
+    async with db_manager.get_engine().connect() as conn:
+        yield await conn.execution_options(isolation_level="AUTOCOMMIT")
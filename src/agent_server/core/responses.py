@@ -0,0 +1,20 @@
+"""JSON response class shared by the API routers."""
+from typing import Any
+
+import orjson
+from starlette.responses import Response
+
+
+class JSONResponse(Response):
+    """orjson response that renders datetimes as UTC ``Z`` like Pydantic does.
+
+    Only read endpoints that already hold plain dicts (e.g. from Core row
+    mappings) return this, so the payload skips response_model validation
+    and is encoded entirely in C. Everything else stays on FastAPI's native
+    Pydantic serialization.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
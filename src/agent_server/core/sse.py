@@ -1,9 +1,10 @@
 """Server-Sent Events utilities and formatting - LangGraph Compatible"""
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 
+import orjson
+
 
 def _serialize_message_object(obj):
     """Custom serializer for LangChain message objects"""
@@ -28,43 +29,49 @@ def _serialize_message_object(obj):
         return str(obj)
 
 
+# Standard SSE headers, built once; callers spread them into their own dict
+_SSE_HEADERS: Dict[str, str] = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Content-Type": "text/event-stream",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Last-Event-ID",
+    # Disable Nginx response buffering so frames reach the client immediately
+    "X-Accel-Buffering": "no",
+}
+
+
+# Comment frame sent on idle streams; ignored by SSE clients but keeps
+# proxies and load balancers from timing out during long generations
+SSE_KEEPALIVE = ": keepalive\n\n"
+# First frame of every stream, sent before any I/O so headers flush at once
+SSE_OPEN = ": open\n\n"
+SSE_KEEPALIVE_INTERVAL = 15.0  # seconds
+
+
 def get_sse_headers() -> Dict[str, str]:
-    """Get standard SSE headers"""
-    return {
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "Content-Type": "text/event-stream",
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "Last-Event-ID",
-    }
+    """Get standard SSE headers (shared dict - copy before mutating)"""
+    return _SSE_HEADERS
+
+
+def _dumps(data: Any, default=_serialize_message_object) -> str:
+    return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def format_sse_message(event: str, data: Any, event_id: Optional[str] = None) -> str:
     """Format a message as Server-Sent Event following SSE standard"""
-    lines = []
-    
-    if event_id:
-        lines.append(f"id: {event_id}")
-    
-    lines.append(f"event: {event}")
-    
     # Convert data to JSON string with proper message object handling
-    if data is None:
-        data_str = ""
-    else:
-        data_str = json.dumps(data, default=_serialize_message_object, separators=(',', ':'))
-    
-    lines.append(f"data: {data_str}")
-    lines.append("")  # Empty line to end the event
-    
-    return "\n".join(lines) + "\n"
+    data_str = "" if data is None else _dumps(data)
+    if event_id:
+        return f"id: {event_id}\nevent: {event}\ndata: {data_str}\n\n"
+    return f"event: {event}\ndata: {data_str}\n\n"
 
 
 def create_metadata_event(run_id: str, event_id: Optional[str] = None) -> str:
     """Create metadata event - equivalent to LangGraph's metadata event"""
     data = {
         "run_id": run_id,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
     return format_sse_message("metadata", data, event_id)
 
@@ -88,7 +95,7 @@ def create_error_event(error: str, event_id: Optional[str] = None) -> str:
     """Create error event"""
     data = {
         "error": error,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
     return format_sse_message("error", data, event_id)
 
@@ -142,17 +149,17 @@ class SSEEvent:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            self.timestamp = datetime.now(timezone.utc)
     
     def format(self) -> str:
         """Format as proper SSE event - deprecated"""
-        json_data = json.dumps(self.data, default=str)
+        json_data = _dumps(self.data, default=str)
         return f"id: {self.id}\nevent: {self.event}\ndata: {json_data}\n\n"
 
 
 def format_sse_event(id: str, event: str, data: Dict[str, Any]) -> str:
     """Legacy format function - deprecated"""
-    json_data = json.dumps(data, default=str)
+    json_data = _dumps(data, default=str)
     return f"id: {id}\nevent: {event}\ndata: {json_data}\n\n"
 
 
@@ -166,7 +173,7 @@ def create_start_event(run_id: str, event_counter: int) -> str:
             "type": "run_start",
             "run_id": run_id,
             "status": "streaming",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -179,7 +186,7 @@ def create_chunk_event(run_id: str, event_counter: int, chunk_data: Dict[str, An
         data={
             "type": "execution_chunk",
             "chunk": chunk_data,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -193,7 +200,7 @@ def create_complete_event(run_id: str, event_counter: int, final_output: Any) ->
             "type": "run_complete",
             "status": "completed",
             "final_output": final_output,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -206,7 +213,7 @@ def create_cancelled_event(run_id: str, event_counter: int) -> str:
         data={
             "type": "run_cancelled",
             "status": "cancelled",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -219,6 +226,6 @@ def create_interrupted_event(run_id: str, event_counter: int) -> str:
         data={
             "type": "run_interrupted",
             "status": "interrupted",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
\ No newline at end of file
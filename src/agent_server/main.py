@@ -2,7 +2,6 @@
 import asyncio
 import os
 from contextlib import asynccontextmanager
-from typing import Dict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -11,26 +10,33 @@ load_dotenv()
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError
 from starlette.middleware.authentication import AuthenticationMiddleware
 
 from .core.database import db_manager
 from .core.health import router as health_router
 from .api.assistants import router as assistants_router
 from .api.threads import router as threads_router
-from .api.runs import router as runs_router
+from .api.runs import router as runs_router, flush_run_status_updates, shutdown_runs
 from .api.store import router as store_router
+from .api.admin import router as admin_router
 from .models.errors import AgentProtocolError, get_error_type
 from .core.auth_middleware import get_auth_backend, on_auth_error
 
-# Task management for run cancellation
-active_runs: Dict[str, asyncio.Task] = {}
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI lifespan context manager for startup/shutdown"""
     # Startup: Initialize database and LangGraph components
     await db_manager.initialize()
+
+    # Apply pending migrations in-band, in the background, or not at all
+    from .core.migrations import MIGRATION_MODE, run_migrations
+    migration_task = None  # held so the background task is not garbage collected
+    if MIGRATION_MODE == "sync":
+        await run_migrations()
+    elif MIGRATION_MODE == "async":
+        migration_task = asyncio.create_task(run_migrations())
     
     # Initialize LangGraph service
     from .services.langgraph_service import get_langgraph_service
@@ -41,17 +47,18 @@ async def lifespan(app: FastAPI):
     from .services.event_store import event_store
     await event_store.start_cleanup_task()
     
-    yield
-    
-    # Shutdown: Clean up connections and cancel active runs
-    for task in active_runs.values():
-        if not task.done():
-            task.cancel()
-    
-    # Stop event store cleanup task
-    await event_store.stop_cleanup_task()
-    
-    await db_manager.close()
+    try:
+        yield
+    finally:
+        # Shutdown: cancel active runs and let them record their final status
+        await shutdown_runs()
+
+        # Stop event store cleanup task and drain buffered events
+        await event_store.stop_cleanup_task()
+        await event_store.flush()
+        await flush_run_status_updates()
+
+        await db_manager.close()
 
 
 # Create FastAPI application
@@ -86,6 +93,7 @@ app.include_router(assistants_router, prefix="", tags=["Assistants"])
 app.include_router(threads_router, prefix="", tags=["Threads"])
 app.include_router(runs_router, prefix="", tags=["Runs"])
 app.include_router(store_router, prefix="", tags=["Store"])
+app.include_router(admin_router, prefix="", tags=["Admin"])
 
 
 # Error handling
@@ -102,6 +110,26 @@ async def agent_protocol_exception_handler(request: Request, exc: HTTPException)
     )
 
 
+@app.exception_handler(DBAPIError)
+async def dbapi_error_handler(request: Request, exc: DBAPIError):
+    """Reject values Postgres cannot coerce (SQLSTATE class 22, data exception).
+
+    asyncpg errors reach us as a generic DBAPIError rather than DataError, so
+    the class is read from the driver's SQLSTATE; anything else is a 500.
+    """
+    sqlstate = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+    if not (sqlstate and str(sqlstate).startswith("22")):
+        return await general_exception_handler(request, exc)
+    return JSONResponse(
+        status_code=422,
+        content=AgentProtocolError(
+            error=get_error_type(422),
+            message="Invalid identifier or value",
+            details={"exception": str(exc.orig)}
+        ).model_dump()
+    )
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions"""
@@ -3,10 +3,12 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from ..utils.ids import UUIDStr
+
 
 class AssistantCreate(BaseModel):
     """Request model for creating assistants"""
-    assistant_id: Optional[str] = Field(None, description="Unique assistant identifier (auto-generated if not provided)")
+    assistant_id: Optional[UUIDStr] = Field(None, description="Unique assistant identifier (auto-generated if not provided)")
     name: Optional[str] = Field(None, description="Human-readable assistant name (auto-generated if not provided)")
     description: Optional[str] = Field(None, description="Assistant description")
     config: Optional[Dict[str, Any]] = Field(None, description="Assistant configuration")
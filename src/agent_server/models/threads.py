@@ -1,5 +1,5 @@
 """Thread-related Pydantic models for Agent Protocol"""
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -68,7 +68,7 @@ class ThreadState(BaseModel):
 class ThreadHistoryRequest(BaseModel):
     """Request model for thread history endpoint"""
     limit: Optional[int] = Field(10, ge=1, le=1000, description="Number of states to return")
-    before: Optional[str] = Field(None, description="Return states before this checkpoint ID")
+    before: Optional[Union[str, Dict[str, Any]]] = Field(None, description="Return states before this checkpoint ID (or checkpoint object)")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Filter by metadata")
     checkpoint: Optional[Dict[str, Any]] = Field(None, description="Checkpoint for subgraph filtering")
     subgraphs: Optional[bool] = Field(False, description="Include states from subgraphs")
@@ -1,17 +1,26 @@
 """Event broker for managing run-specific event queues"""
 import asyncio
-from typing import Any, AsyncIterator, Tuple
+from typing import Any, AsyncIterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _is_end(payload: Any) -> bool:
+    return isinstance(payload, tuple) and len(payload) >= 1 and payload[0] == "end"
+
+
 class RunBroker:
     """Manages event queuing and distribution for a specific run"""
+
+    # Live events buffered per run. When no consumer keeps up (or none is
+    # attached, as for background runs) the oldest are dropped; every event
+    # is also in the event store, from which consumers backfill gaps.
+    MAX_QUEUE_SIZE = 1024
     
     def __init__(self, run_id: str):
         self.run_id = run_id
-        self.queue: asyncio.Queue[Tuple[str, Any]] = asyncio.Queue()
+        self.queue: asyncio.Queue[Tuple[str, Any]] = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
         self.finished = asyncio.Event()
         self._created_at = asyncio.get_event_loop().time()
     
@@ -21,10 +30,13 @@ class RunBroker:
             logger.warning(f"Attempted to put event {event_id} into finished broker for run {self.run_id}")
             return
         
-        await self.queue.put((event_id, payload))
+        if self.queue.full():
+            # Never block the run on a slow or absent consumer
+            self.queue.get_nowait()
+        self.queue.put_nowait((event_id, payload))
         
         # Check if this is an end event
-        if isinstance(payload, tuple) and len(payload) >= 1 and payload[0] == "end":
+        if _is_end(payload):
             self.mark_finished()
     
     async def aiter(self) -> AsyncIterator[Tuple[str, Any]]:
@@ -36,7 +48,7 @@ class RunBroker:
                 yield event_id, payload
                 
                 # Check if this is an end event
-                if isinstance(payload, tuple) and len(payload) >= 1 and payload[0] == "end":
+                if _is_end(payload):
                     break
                     
             except asyncio.TimeoutError:
@@ -45,6 +57,38 @@ class RunBroker:
                     break
                 continue
     
+    async def aiter_batches(self, keepalive: float | None = None) -> AsyncIterator[List[Tuple[str, Any]]]:
+        """Async iterator yielding every event already queued as one batch.
+
+        Waits for the first event like ``aiter`` and then drains whatever else
+        is ready without blocking, so a burst of events becomes one socket write.
+        With ``keepalive`` set, an empty batch is yielded after that many idle
+        seconds so the consumer can emit a heartbeat.
+        """
+        loop = asyncio.get_running_loop()
+        last_yield = loop.time()
+        while True:
+            try:
+                first = await asyncio.wait_for(self.queue.get(), timeout=0.1)
+            except asyncio.TimeoutError:
+                if self.finished.is_set() and self.queue.empty():
+                    break
+                if keepalive is not None and loop.time() - last_yield >= keepalive:
+                    last_yield = loop.time()
+                    yield []
+                continue
+
+            batch = [first]
+            end_seen = _is_end(first[1])
+            while not end_seen and not self.queue.empty():
+                item = self.queue.get_nowait()
+                batch.append(item)
+                end_seen = _is_end(item[1])
+            yield batch
+            last_yield = loop.time()
+            if end_seen:
+                break
+
     def mark_finished(self) -> None:
         """Mark this broker as finished"""
         self.finished.set()
@@ -1,23 +1,54 @@
 """Persistent event store for SSE replay functionality (Postgres-backed)."""
 import asyncio
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import logging
+from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import text, bindparam
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import text
 
 from ..core.sse import SSEEvent, _serialize_message_object
-import json
+import orjson
 from ..core.database import db_manager
 
+logger = logging.getLogger(__name__)
+
+# Column order used for COPY records: (id, run_id, seq, event, data)
+_COPY_COLUMNS = ["id", "run_id", "seq", "event", "data"]
+
+# Same columns, skipping rows that are already stored
+_INSERT_IGNORE_SQL = (
+    "INSERT INTO run_events (id, run_id, seq, event, data) "
+    "VALUES ($1, $2, $3, $4, $5) ON CONFLICT (id) DO NOTHING"
+)
+
+
+def _row_to_event(row) -> SSEEvent:
+    """Build an SSEEvent from a run_events row whose data is UTF-8 JSON bytes."""
+    data = orjson.loads(row.data) if row.data is not None else {}
+    return SSEEvent(id=row.id, event=row.event, data=data, timestamp=row.created_at)
+
 
 class EventStore:
-    """Postgres-backed event store for SSE replay functionality"""
+    """Postgres-backed event store for SSE replay functionality.
+
+    Writes are buffered in-process and flushed with a single binary COPY
+    once ``FLUSH_BATCH_SIZE`` rows are pending or ``FLUSH_INTERVAL`` has
+    elapsed, whichever comes first. Reads flush the buffer first so replay
+    always sees every event accepted so far.
+    """
 
     CLEANUP_INTERVAL = 300  # seconds
+    FLUSH_INTERVAL = 0.05  # seconds
+    FLUSH_BATCH_SIZE = 500
+    FLUSH_RETRY_DELAY = 1.0  # seconds
+    MAX_FLUSH_ATTEMPTS = 3
 
     def __init__(self) -> None:
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._pending: List[Tuple[str, str, int, str, bytes]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_flushes: Set[asyncio.Task] = set()
+        self._flush_lock = asyncio.Lock()
+        self._failed_flushes = 0
 
     async def start_cleanup_task(self) -> None:
         if self._cleanup_task is None or self._cleanup_task.done():
@@ -36,32 +67,89 @@ class EventStore:
 
         We expect event.id format: f"{run_id}_event_{seq}".
         """
+        await self.append(run_id, event.id, event.event, orjson.dumps(event.data, default=str))
+
+    async def append(self, run_id: str, event_id: str, event_type: str, data_json: bytes) -> None:
+        """Buffer a pre-serialized (UTF-8 JSON) event for the next COPY flush."""
         try:
-            seq = int(str(event.id).split("_event_")[-1])
+            seq = int(str(event_id).split("_event_")[-1])
         except Exception:
             seq = 0
+        self._pending.append((event_id, run_id, seq, event_type, data_json))
+
+        if len(self._pending) >= self.FLUSH_BATCH_SIZE:
+            # COPY the full batch in the background so the producing run never
+            # waits on Postgres; flush() serializes on the lock, so explicit
+            # flushes still observe every earlier batch
+            task = asyncio.create_task(self.flush())
+            self._batch_flushes.add(task)
+            task.add_done_callback(self._batch_flushes.discard)
+        else:
+            self._schedule_flush(self.FLUSH_INTERVAL)
+
+    def _schedule_flush(self, delay: float) -> None:
+        current = asyncio.current_task()
+        if self._flush_task is None or self._flush_task.done() or self._flush_task is current:
+            self._flush_task = asyncio.create_task(self._flush_after_interval(delay))
+
+    async def _flush_after_interval(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered events to Postgres using asyncpg's binary COPY.
+
+        A failed batch is re-queued and retried after ``FLUSH_RETRY_DELAY``;
+        it is dropped, with an error logged, only after
+        ``MAX_FLUSH_ATTEMPTS`` consecutive failures.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            records, self._pending = self._pending, []
+            try:
+                await self._write_records(records)
+            except Exception:
+                self._failed_flushes += 1
+                if self._failed_flushes >= self.MAX_FLUSH_ATTEMPTS:
+                    logger.exception(
+                        "Dropping %d run events after %d failed flush attempts",
+                        len(records), self._failed_flushes,
+                    )
+                    self._failed_flushes = 0
+                    return
+                logger.warning(
+                    "Failed to flush %d run events (attempt %d/%d), retrying",
+                    len(records), self._failed_flushes, self.MAX_FLUSH_ATTEMPTS,
+                    exc_info=True,
+                )
+                # Keep the failed batch ahead of anything appended meanwhile
+                self._pending[:0] = records
+                self._schedule_flush(self.FLUSH_RETRY_DELAY)
+            else:
+                self._failed_flushes = 0
+
+    async def _write_records(self, records: List[Tuple[str, str, int, str, bytes]]) -> None:
+        """COPY a batch, falling back to an idempotent INSERT on failure.
+
+        COPY cannot skip duplicate ids, so a batch that overlaps rows already
+        stored (e.g. a retry after a partially acknowledged flush) is
+        re-written with ``ON CONFLICT (id) DO NOTHING``.
+        """
         engine = db_manager.get_engine()
-        async with engine.begin() as conn:
-            stmt = text(
-                """
-                INSERT INTO run_events (id, run_id, seq, event, data, created_at)
-                VALUES (:id, :run_id, :seq, :event, :data, NOW())
-                ON CONFLICT (id) DO NOTHING
-                """
-            ).bindparams(bindparam("data", type_=JSONB))
-            await conn.execute(
-                stmt,
-                {
-                    "id": event.id,
-                    "run_id": run_id,
-                    "seq": seq,
-                    "event": event.event,
-                    "data": event.data,
-                },
-            )
+        async with engine.connect() as conn:
+            raw = (await conn.get_raw_connection()).driver_connection
+            try:
+                await raw.copy_records_to_table(
+                    "run_events", records=records, columns=_COPY_COLUMNS
+                )
+            except Exception:
+                logger.debug("COPY of %d run events failed, falling back to INSERT", len(records), exc_info=True)
+                await raw.executemany(_INSERT_IGNORE_SQL, records)
 
     async def get_events_since(self, run_id: str, last_event_id: str) -> List[SSEEvent]:
         """Fetch all events for run after last_event_id sequence."""
+        await self.flush()
         try:
             last_seq = int(str(last_event_id).split("_event_")[-1])
         except Exception:
@@ -80,9 +168,10 @@ class EventStore:
                 {"run_id": run_id, "last_seq": last_seq},
             )
             rows = rs.fetchall()
-        return [SSEEvent(id=r.id, event=r.event, data=r.data, timestamp=r.created_at) for r in rows]
+        return [_row_to_event(r) for r in rows]
 
     async def get_all_events(self, run_id: str) -> List[SSEEvent]:
+        await self.flush()
         engine = db_manager.get_engine()
         async with engine.begin() as conn:
             rs = await conn.execute(
@@ -97,14 +186,16 @@ class EventStore:
                 {"run_id": run_id},
             )
             rows = rs.fetchall()
-        return [SSEEvent(id=r.id, event=r.event, data=r.data, timestamp=r.created_at) for r in rows]
+        return [_row_to_event(r) for r in rows]
 
     async def cleanup_events(self, run_id: str) -> None:
+        await self.flush()
         engine = db_manager.get_engine()
         async with engine.begin() as conn:
             await conn.execute(text("DELETE FROM run_events WHERE run_id = :run_id"), {"run_id": run_id})
 
     async def get_run_info(self, run_id: str) -> Optional[Dict]:
+        await self.flush()
         engine = db_manager.get_engine()
         async with engine.begin() as conn:
             rs = await conn.execute(
@@ -167,12 +258,10 @@ event_store = EventStore()
 
 
 async def store_sse_event(run_id: str, event_id: str, event_type: str, data: Dict):
-    # Ensure JSONB-safe data by serializing complex message objects
+    # Serialize once at enqueue time, converting complex message objects
     try:
-        safe_data = json.loads(json.dumps(data, default=_serialize_message_object))
+        data_json = orjson.dumps(data, default=_serialize_message_object, option=orjson.OPT_NON_STR_KEYS)
     except Exception:
         # Fallback to stringifying as a last resort to avoid crashing the run
-        safe_data = {"raw": str(data)}
-    event = SSEEvent(id=event_id, event=event_type, data=safe_data, timestamp=datetime.utcnow())
-    await event_store.store_event(run_id, event)
-    return event
\ No newline at end of file
+        data_json = orjson.dumps({"raw": str(data)})
+    await event_store.append(run_id, event_id, event_type, data_json)
@@ -1,12 +1,16 @@
 """LangGraph integration service with official patterns"""
+import asyncio
 import json
 import os
 import importlib.util
 from typing import Dict, Any, Optional, TypeVar
 from pathlib import Path
 from langgraph.graph import StateGraph
+from sqlalchemy import select
 from uuid import UUID, uuid5
 from ..constants import ASSISTANT_NAMESPACE_UUID
+from ..core.database import db_manager
+from ..core.orm import Assistant as AssistantORM, get_session
 
 State = TypeVar("State")
 
@@ -20,6 +24,8 @@ class LangGraphService:
         self.config: Optional[Dict[str, Any]] = None
         self._graph_registry: Dict[str, Any] = {}
         self._graph_cache: Dict[str, Any] = {}
+        self._graph_listing: Optional[Dict[str, str]] = None
+        self._graph_locks: Dict[str, asyncio.Lock] = {}
         
     async def initialize(self):
         """Load configuration file and setup graph registry.
@@ -67,6 +73,8 @@ class LangGraphService:
     def _load_graph_registry(self):
         """Load graph definitions from aegra.json"""
         graphs_config = self.config.get("graphs", {})
+        self._graph_registry = {}
+        self._graph_listing = None
         
         for graph_id, graph_path in graphs_config.items():
             # Parse path format: "./graphs/weather_agent.py:graph"
@@ -85,8 +93,6 @@ class LangGraphService:
         Uses uuid5 with a fixed namespace so that the same graph_id maps
         to the same assistant_id across restarts. Idempotent.
         """
-        from ..core.orm import Assistant as AssistantORM, get_session
-        from sqlalchemy import select
         # Fixed namespace used to derive assistant IDs from graph IDs
         NS = ASSISTANT_NAMESPACE_UUID
         async for session in get_session():
@@ -120,19 +126,28 @@ class LangGraphService:
         # Return cached graph if available and not forcing reload
         if not force_reload and graph_id in self._graph_cache:
             return self._graph_cache[graph_id]
-        
+
+        # Single-flight: concurrent cold requests for a graph share one load
+        lock = self._graph_locks.setdefault(graph_id, asyncio.Lock())
+        async with lock:
+            if not force_reload and graph_id in self._graph_cache:
+                return self._graph_cache[graph_id]
+            compiled_graph = await self._build_graph(graph_id)
+            # Cache the compiled graph
+            self._graph_cache[graph_id] = compiled_graph
+        return compiled_graph
+
+    async def _build_graph(self, graph_id: str):
+        """Load a graph module and attach our Postgres checkpointer and store"""
         graph_info = self._graph_registry[graph_id]
         
         # Load graph from file
         base_graph = await self._load_graph_from_file(graph_id, graph_info)
         
         # Always ensure graphs are compiled with our Postgres checkpointer for persistence
-        from ..core.database import db_manager
-        
         if hasattr(base_graph, 'compile'):
             # The module exported an *uncompiled* StateGraph – compile it now with
             # a Postgres checkpointer for durable state.
-            from ..core.database import db_manager
             checkpointer_cm = await db_manager.get_checkpointer()
             store_cm = await db_manager.get_store()
             print(f"🔧 Compiling graph '{graph_id}' with Postgres persistence")
@@ -141,7 +156,6 @@ class LangGraphService:
             # Graph was already compiled by the module.  Create a shallow copy
             # that injects our Postgres checkpointer *unless* the author already
             # set one.
-            from ..core.database import db_manager
             checkpointer_cm = await db_manager.get_checkpointer()
             try:
                 store_cm = await db_manager.get_store()
@@ -150,14 +164,19 @@ class LangGraphService:
                 # Fallback: property may be immutably set; run as-is with warning
                 print(f"⚠️  Pre-compiled graph '{graph_id}' does not support checkpointer injection; running without persistence")
                 compiled_graph = base_graph
-        
-        # Cache the compiled graph
-        self._graph_cache[graph_id] = compiled_graph
-        
+
         return compiled_graph
     
     async def _load_graph_from_file(self, graph_id: str, graph_info: Dict[str, str]):
-        """Load graph from filesystem"""
+        """Load graph from filesystem.
+
+        Module execution (file IO, imports, graph construction) is blocking,
+        so it runs on a worker thread to keep the event loop serving streams.
+        """
+        return await asyncio.to_thread(self._import_graph, graph_id, graph_info)
+
+    def _import_graph(self, graph_id: str, graph_info: Dict[str, str]):
+        """Import the graph module and return its exported graph (blocking)"""
         file_path = Path(graph_info["file_path"])
         if not file_path.exists():
             raise ValueError(f"Graph file not found: {file_path}")
@@ -182,11 +201,13 @@ class LangGraphService:
         return graph
     
     def list_graphs(self) -> Dict[str, str]:
-        """List all available graphs"""
-        return {
-            graph_id: info["file_path"] 
-            for graph_id, info in self._graph_registry.items()
-        }
+        """List all available graphs (memoized until the registry is reloaded)"""
+        if self._graph_listing is None:
+            self._graph_listing = {
+                graph_id: info["file_path"]
+                for graph_id, info in self._graph_registry.items()
+            }
+        return self._graph_listing
     
     def invalidate_cache(self, graph_id: str = None):
         """Invalidate graph cache for hot-reload"""
@@ -195,6 +216,22 @@ class LangGraphService:
         else:
             self._graph_cache.clear()
     
+    def _read_config(self) -> Dict[str, Any]:
+        with open(self.config_path) as f:
+            return json.load(f)
+
+    async def reload(self) -> Dict[str, str]:
+        """Re-read the config file and drop every cached graph.
+
+        Intended for deploys that change aegra.json or graph sources without
+        restarting the process. Returns the new graph listing.
+        """
+        self.config = await asyncio.to_thread(self._read_config)
+        self._load_graph_registry()
+        self.invalidate_cache()
+        await self._ensure_default_assistants()
+        return self.list_graphs()
+    
     def get_config(self) -> Optional[Dict[str, Any]]:
         """Get loaded configuration"""
         return self.config
@@ -249,36 +286,34 @@ def create_run_config(run_id: str, thread_id: str, user, additional_config: Dict
     supplied.  We simply ensure a `configurable` dict exists and then merge a
     few server-side keys so graph nodes can rely on them.
     """
-    from copy import deepcopy
-
-    cfg: Dict = deepcopy(additional_config) if additional_config else {}
+    # Shallow copies: only the top level and ``configurable`` are mutated here,
+    # so deep-copying arbitrary client payloads per run is unnecessary
+    cfg: Dict = dict(additional_config) if additional_config else {}
 
     # Ensure a configurable section exists
-    cfg.setdefault("configurable", {})
+    configurable = dict(cfg.get("configurable") or {})
+    cfg["configurable"] = configurable
 
     # Merge server-provided fields (do NOT overwrite if client already set)
-    cfg["configurable"].setdefault("thread_id", thread_id)
-    cfg["configurable"].setdefault("run_id", run_id)
-
-    # Basic user identity for multi-tenant scoping
-    cfg["configurable"].setdefault("user_id", user.identity)
-    cfg["configurable"].setdefault(
-        "user_display_name", getattr(user, "display_name", user.identity)
-    )
+    configurable.setdefault("thread_id", thread_id)
+    configurable.setdefault("run_id", run_id)
 
     # Full auth payload so graph nodes can do things like
     #   auth_ctx = config["configurable"]["langgraph_auth_user"]
-    if "langgraph_auth_user" not in cfg["configurable"]:
+    if "langgraph_auth_user" not in configurable:
         try:
-            cfg["configurable"]["langgraph_auth_user"] = user.to_dict()  # type: ignore[attr-defined]
+            configurable["langgraph_auth_user"] = user.to_dict()  # type: ignore[attr-defined]
         except Exception:
             # Fallback: minimal dict if to_dict unavailable
-            cfg["configurable"]["langgraph_auth_user"] = {
+            configurable["langgraph_auth_user"] = {
                 "identity": user.identity
             }
     # Apply checkpoint parameters if provided
     if checkpoint and isinstance(checkpoint, dict):
-        cfg["configurable"].update({k: v for k, v in checkpoint.items() if v is not None})
+        configurable.update({k: v for k, v in checkpoint.items() if v is not None})
 
-    # Finally inject any remaining user context via existing helper
-    return inject_user_context(user, cfg)
\ No newline at end of file
+    # Basic user identity for multi-tenant scoping; always server-side, as
+    # inject_user_context would set it (done inline to skip another copy)
+    configurable["user_id"] = user.identity
+    configurable["user_display_name"] = getattr(user, "display_name", user.identity)
+    return cfg
\ No newline at end of file
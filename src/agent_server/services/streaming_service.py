@@ -8,7 +8,8 @@ from ..core.sse import (
     create_metadata_event, create_values_event, 
     create_end_event, create_error_event, create_events_event,
     create_messages_event, create_state_event, create_logs_event,
-    create_tasks_event, create_subgraphs_event, create_debug_event
+    create_tasks_event, create_subgraphs_event, create_debug_event,
+    SSE_KEEPALIVE, SSE_KEEPALIVE_INTERVAL, SSE_OPEN,
 )
 from .event_store import event_store, store_sse_event
 from .langgraph_service import get_langgraph_service, create_run_config
@@ -17,6 +18,19 @@ from .broker import broker_manager
 logger = logging.getLogger(__name__)
 
 
+# Stream mode label -> SSE frame builder called as (payload, event_id)
+_RAW_EVENT_FORMATTERS = {
+    "messages": lambda payload, event_id: create_messages_event(payload, event_id=event_id),
+    "values": create_values_event,
+    "state": create_state_event,
+    "logs": create_logs_event,
+    "tasks": create_tasks_event,
+    "subgraphs": create_subgraphs_event,
+    "debug": create_debug_event,
+    "end": lambda payload, event_id: create_end_event(event_id),
+}
+
+
 class StreamingService:
     """Service to handle SSE streaming orchestration with LangGraph compatibility"""
     
@@ -43,6 +57,16 @@ class StreamingService:
         self._next_event_counter(run_id, event_id)
         await broker.put(event_id, raw_event)
     
+    async def publish(self, run_id: str, event_id: str, raw_event: Any):
+        """Hand a run event to live consumers and to the replay store.
+
+        Neither step suspends on the common path (the broker queue is bounded
+        but never blocks, storage appends to the event store's batch buffer),
+        so one call per event keeps the producer's loop tight.
+        """
+        await self.put_to_broker(run_id, event_id, raw_event)
+        await self.store_event_from_raw(run_id, event_id, raw_event)
+    
     async def store_event_from_raw(self, run_id: str, event_id: str, raw_event: Any):
         """Convert raw event to stored format and store it"""
         # Parse the raw event similar to existing logic
@@ -84,14 +108,14 @@ class StreamingService:
                 run_id,
                 event_id,
                 "end",
-                {"type": "run_complete", "status": event_payload.get("status", "completed"), "final_output": event_payload.get("final_output")},
+                {"type": "run_complete", "status": event_payload.get("status", "completed")},
             )
         # Add other stream modes as needed
     
     async def signal_run_cancelled(self, run_id: str):
         """Signal that a run was cancelled"""
-        counter = self.event_counters.get(run_id, 0) + 1
-        self.event_counters[run_id] = counter
+        # Terminal event: release the counter instead of storing the new value
+        counter = self.event_counters.pop(run_id, 0) + 1
         event_id = f"{run_id}_event_{counter}"
         
         broker = broker_manager.get_or_create_broker(run_id)
@@ -102,8 +126,8 @@ class StreamingService:
     
     async def signal_run_error(self, run_id: str, error_message: str):
         """Signal that a run encountered an error"""
-        counter = self.event_counters.get(run_id, 0) + 1
-        self.event_counters[run_id] = counter
+        # Terminal event: release the counter instead of storing the new value
+        counter = self.event_counters.pop(run_id, 0) + 1
         event_id = f"{run_id}_event_{counter}"
         
         broker = broker_manager.get_or_create_broker(run_id)
@@ -127,6 +151,8 @@ class StreamingService:
     ) -> AsyncIterator[str]:
         """Stream run execution with unified producer-consumer pattern"""
         run_id = run.run_id
+        # Flush headers before replay queries or the first graph event
+        yield SSE_OPEN
         try:
             # -------- Replay stored events once --------
             if last_event_id:
@@ -152,17 +178,41 @@ class StreamingService:
             
             # Consume live events from broker if run is still active
             if broker:
-                async for event_id, raw_event in broker.aiter():
-                    # Skip duplicates that were already replayed - compare numeric sequences
-                    current_sequence = self._extract_event_sequence(event_id)
-                    if last_sent_event_id is not None and current_sequence <= last_sent_sequence:
+                # Highest sequence observed, including events that produce no frame
+                last_seen_sequence = last_sent_sequence
+                # Coalesce events that arrived together into a single write
+                async for batch in broker.aiter_batches(keepalive=SSE_KEEPALIVE_INTERVAL):
+                    if not batch:
+                        yield SSE_KEEPALIVE
                         continue
+                    frames = []
+                    for event_id, raw_event in batch:
+                        # Skip duplicates that were already replayed - compare numeric sequences
+                        current_sequence = self._extract_event_sequence(event_id)
+                        if last_sent_event_id is not None and current_sequence <= last_sent_sequence:
+                            continue
+
+                        if current_sequence > last_seen_sequence + 1:
+                            # The bounded broker dropped events we never saw;
+                            # backfill them from the event store
+                            missed = await event_store.get_events_since(
+                                run_id, f"{run_id}_event_{last_seen_sequence}"
+                            )
+                            for ev in missed:
+                                if self._extract_event_sequence(ev.id) >= current_sequence:
+                                    break
+                                stored_frame = self._stored_event_to_sse(run_id, ev)
+                                if stored_frame:
+                                    frames.append(stored_frame)
+                        last_seen_sequence = current_sequence
 
-                    sse_event = await self._convert_raw_to_sse(event_id, raw_event)
-                    if sse_event:
-                        yield sse_event
-                        last_sent_event_id = event_id
-                        last_sent_sequence = current_sequence
+                        sse_event = self._convert_raw_to_sse(event_id, raw_event)
+                        if sse_event:
+                            frames.append(sse_event)
+                            last_sent_event_id = event_id
+                            last_sent_sequence = current_sequence
+                    if frames:
+                        yield "".join(frames)
                 
         except asyncio.CancelledError:
             logger.debug(f"Stream cancelled for run {run_id}")
@@ -181,41 +231,20 @@ class StreamingService:
             logger.error(f"Error in stream_run_execution for run {run_id}: {e}")
             yield create_error_event(str(e))
     
-    async def _convert_raw_to_sse(self, event_id: str, raw_event: Any) -> Optional[str]:
+    def _convert_raw_to_sse(self, event_id: str, raw_event: Any) -> Optional[str]:
         """Convert a raw event from broker to SSE format using the provided event_id"""
-        # Parse raw_event similar to earlier logic
-        node_path = None
-        stream_mode_label = None
-        event_payload = None
-
         if isinstance(raw_event, tuple):
             if len(raw_event) == 2:
                 stream_mode_label, event_payload = raw_event
             elif len(raw_event) == 3:
-                node_path, stream_mode_label, event_payload = raw_event
+                _, stream_mode_label, event_payload = raw_event
+            else:
+                return None
         else:
-            stream_mode_label = "values"
-            event_payload = raw_event
+            stream_mode_label, event_payload = "values", raw_event
 
-        # Convert to SSE event
-        if stream_mode_label == "messages":
-            return create_messages_event(event_payload, event_id=event_id)
-        elif stream_mode_label == "values":
-            return create_values_event(event_payload, event_id)
-        elif stream_mode_label == "state":
-            return create_state_event(event_payload, event_id)
-        elif stream_mode_label == "logs":
-            return create_logs_event(event_payload, event_id)
-        elif stream_mode_label == "tasks":
-            return create_tasks_event(event_payload, event_id)
-        elif stream_mode_label == "subgraphs":
-            return create_subgraphs_event(event_payload, event_id)
-        elif stream_mode_label == "debug":
-            return create_debug_event(event_payload, event_id)
-        elif stream_mode_label == "end":
-            return create_end_event(event_id)
-        
-        return None
+        formatter = _RAW_EVENT_FORMATTERS.get(stream_mode_label)
+        return formatter(event_payload, event_id) if formatter is not None else None
     
     async def interrupt_run(self, run_id: str) -> bool:
         """Interrupt a running execution"""
@@ -254,24 +283,11 @@ class StreamingService:
     async def cleanup_run(self, run_id: str):
         """Clean up streaming resources for a run"""
         self.active_streams.pop(run_id, None)
+        self.event_counters.pop(run_id, None)
         broker_manager.cleanup_broker(run_id)
 
     def _stored_event_to_sse(self, run_id: str, ev) -> Optional[str]:
         """Convert stored event object to SSE string"""
-        from ..core.sse import (
-            create_messages_event,
-            create_values_event,
-            create_metadata_event,
-            create_state_event,
-            create_logs_event,
-            create_tasks_event,
-            create_subgraphs_event,
-            create_debug_event,
-            create_events_event,
-            create_end_event,
-            create_error_event,
-        )
-
         if ev.event == "messages":
             message_chunk = ev.data.get("message_chunk")
             metadata = ev.data.get("metadata")
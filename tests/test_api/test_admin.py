@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from agent_server.api import admin as admin_module
+from tests.utils.test_helpers import DummyUser
+
+
+class PermissionedUser(DummyUser):
+    def __init__(self, permissions):
+        super().__init__()
+        self.permissions = permissions
+
+    def to_dict(self):
+        return {**super().to_dict(), "permissions": self.permissions}
+
+
+class FakeReloadService:
+    reloaded = False
+
+    async def reload(self):
+        self.reloaded = True
+        return {"agent": "./graphs/agent.py:graph"}
+
+
+def _client(permissions) -> TestClient:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def inject_user(request, call_next):
+        request.scope["user"] = PermissionedUser(permissions)
+        return await call_next(request)
+
+    app.include_router(admin_module.router)
+    return TestClient(app)
+
+
+def test_reload_graphs_requires_admin_permission():
+    service = FakeReloadService()
+    with patch.object(admin_module, "get_langgraph_service", return_value=service):
+        resp = _client([]).post("/admin/graphs/reload")
+
+    assert resp.status_code == 403
+    assert service.reloaded is False
+
+
+def test_reload_graphs_with_admin_permission():
+    service = FakeReloadService()
+    with patch.object(admin_module, "get_langgraph_service", return_value=service):
+        resp = _client(["admin"]).post("/admin/graphs/reload")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "reloaded", "graphs": ["agent"]}
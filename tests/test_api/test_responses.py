@@ -0,0 +1,14 @@
+from datetime import datetime, timezone
+
+import orjson
+
+from agent_server.core.responses import JSONResponse
+
+
+def test_json_response_renders_utc_z_and_non_str_keys():
+    created = datetime(2026, 10, 15, 9, 30, tzinfo=timezone.utc)
+    resp = JSONResponse({"created_at": created, "counts": {1: "a"}})
+
+    assert resp.media_type == "application/json"
+    assert resp.headers["content-type"] == "application/json"
+    assert orjson.loads(resp.body) == {"created_at": "2026-10-15T09:30:00Z", "counts": {"1": "a"}}
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from agent_server.core.orm import Run as RunORM
+from agent_server.models import Run
+
+
+def test_run_model_validates_directly_from_orm_row():
+    now = datetime.now(timezone.utc)
+    row = RunORM(
+        run_id="0190b3a8-7c3e-7b1a-9f00-000000000001",
+        thread_id="0190b3a8-7c3e-7b1a-9f00-000000000002",
+        assistant_id="0190b3a8-7c3e-7b1a-9f00-000000000003",
+        status="completed",
+        input={"q": 1},
+        config=None,
+        output={},
+        error_message=None,
+        user_id="user-1",
+        created_at=now,
+        updated_at=now,
+    )
+
+    run = Run.model_validate(row)
+
+    assert run.run_id == row.run_id
+    assert run.status == "completed"
+    assert run.input == {"q": 1}
+    assert run.created_at == now
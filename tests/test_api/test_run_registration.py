@@ -0,0 +1,30 @@
+import asyncio
+import logging
+
+from agent_server.api import runs as runs_module
+
+
+async def test_register_run_warns_once_per_threshold_crossing(monkeypatch, caplog):
+    monkeypatch.setattr(runs_module, "ACTIVE_RUNS_WARN_THRESHOLD", 1)
+    monkeypatch.setattr(runs_module, "_active_runs_over_threshold", False)
+    loop = asyncio.get_running_loop()
+    tasks = [loop.create_future() for _ in range(4)]
+
+    with caplog.at_level(logging.WARNING, logger=runs_module.logger.name):
+        for i, task in enumerate(tasks):
+            runs_module._register_run(f"run-{i}", task)
+        assert len(caplog.records) == 1
+
+        # Dropping back under the threshold re-arms the warning
+        for task in tasks:
+            task.cancel()
+        await asyncio.sleep(0)
+        later = [loop.create_future() for _ in range(2)]
+        runs_module._register_run("run-4", later[0])
+        runs_module._register_run("run-5", later[1])
+        assert len(caplog.records) == 2
+
+    for task in later:
+        task.cancel()
+    for i in range(6):
+        runs_module.active_runs.pop(f"run-{i}", None)
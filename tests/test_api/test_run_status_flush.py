@@ -0,0 +1,57 @@
+from agent_server.api import runs as runs_module
+
+
+class FailingSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    async def execute(self, _stmt, params=None):
+        self.calls.append(params)
+        raise RuntimeError("database unavailable")
+
+    async def commit(self):
+        return None
+
+
+async def test_failed_status_flush_requeues_then_drops(monkeypatch):
+    calls = []
+    monkeypatch.setattr(runs_module, "_get_session_maker", lambda: lambda: FailingSession(calls))
+    monkeypatch.setattr(runs_module, "_schedule_status_flush", lambda _delay: None)
+    monkeypatch.setattr(runs_module, "_status_flush_failures", 0)
+    monkeypatch.setattr(runs_module, "_pending_status_updates", {"run-1": "pending"})
+
+    await runs_module.flush_run_status_updates()
+    assert runs_module._pending_status_updates == {"run-1": "pending"}
+
+    # A newer status queued before the retry wins over the re-queued one
+    runs_module._pending_status_updates["run-1"] = "running"
+    for _ in range(runs_module.STATUS_FLUSH_MAX_ATTEMPTS - 1):
+        await runs_module.flush_run_status_updates()
+
+    assert calls[-1] == [{"b_run_id": "run-1", "b_status": "running"}]
+    assert len(calls) == runs_module.STATUS_FLUSH_MAX_ATTEMPTS
+    assert runs_module._pending_status_updates == {}
+
+
+async def test_status_queued_during_failed_flush_is_kept(monkeypatch):
+    pending = {"run-1": "pending"}
+
+    class RacingSession(FailingSession):
+        async def execute(self, _stmt, params=None):
+            pending["run-1"] = "running"
+            raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(runs_module, "_get_session_maker", lambda: lambda: RacingSession([]))
+    monkeypatch.setattr(runs_module, "_schedule_status_flush", lambda _delay: None)
+    monkeypatch.setattr(runs_module, "_status_flush_failures", 0)
+    monkeypatch.setattr(runs_module, "_pending_status_updates", pending)
+
+    await runs_module.flush_run_status_updates()
+
+    assert pending == {"run-1": "running"}
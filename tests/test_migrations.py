@@ -0,0 +1,60 @@
+import ast
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _script_directory() -> ScriptDirectory:
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+def test_migrations_have_single_head():
+    heads = _script_directory().get_heads()
+    assert len(heads) == 1, f"Multiple alembic heads: {heads}"
+
+
+def test_migrations_have_single_base():
+    bases = _script_directory().get_bases()
+    assert len(bases) == 1, f"Multiple initial revisions: {bases}"
+
+
+def _index_calls(path: Path):
+    tree = ast.parse(path.read_text())
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "op"
+            and node.func.attr in ("create_index", "drop_index")
+        ):
+            yield node
+
+
+def test_follow_up_migrations_build_indexes_concurrently():
+    """Only the initial migration (empty tables) may create/drop indexes in a transaction."""
+    script = _script_directory()
+    base = script.get_bases()[0]
+    offenders = []
+    for revision in script.walk_revisions():
+        if revision.revision == base:
+            continue
+        path = Path(revision.path)
+        for call in _index_calls(path):
+            kwargs = {kw.arg: kw.value for kw in call.keywords}
+            concurrently = kwargs.get("postgresql_concurrently")
+            if not (isinstance(concurrently, ast.Constant) and concurrently.value is True):
+                offenders.append(f"{path.name}:{call.lineno}")
+    assert not offenders, f"Index DDL without postgresql_concurrently=True: {offenders}"
+
+
+def test_in_process_migrations_keep_application_logging():
+    from agent_server.core.migrations import _alembic_config
+
+    assert _alembic_config().attributes["configure_logger"] is False
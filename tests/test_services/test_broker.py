@@ -0,0 +1,43 @@
+import asyncio
+
+from agent_server.services.broker import RunBroker
+
+
+async def test_aiter_batches_coalesces_queued_events():
+    broker = RunBroker("run-1")
+    await broker.put("run-1_event_1", ("values", {"a": 1}))
+    await broker.put("run-1_event_2", ("values", {"a": 2}))
+    await broker.put("run-1_event_3", ("end", {"status": "completed"}))
+
+    batches = [batch async for batch in broker.aiter_batches()]
+
+    assert [[event_id for event_id, _ in batch] for batch in batches] == [
+        ["run-1_event_1", "run-1_event_2", "run-1_event_3"]
+    ]
+
+
+async def test_aiter_batches_yields_empty_batch_when_idle():
+    broker = RunBroker("run-2")
+
+    async def produce():
+        await asyncio.sleep(0.35)
+        await broker.put("run-2_event_1", ("end", {"status": "completed"}))
+
+    producer = asyncio.create_task(produce())
+    batches = [batch async for batch in broker.aiter_batches(keepalive=0.1)]
+    await producer
+
+    assert [] in batches
+    assert batches[-1][0][0] == "run-2_event_1"
+
+
+async def test_put_drops_oldest_event_when_queue_is_full(monkeypatch):
+    monkeypatch.setattr(RunBroker, "MAX_QUEUE_SIZE", 2)
+    broker = RunBroker("run-3")
+    for seq in range(1, 4):
+        await broker.put(f"run-3_event_{seq}", ("values", {"seq": seq}))
+
+    assert [broker.queue.get_nowait()[0] for _ in range(broker.queue.qsize())] == [
+        "run-3_event_2",
+        "run-3_event_3",
+    ]
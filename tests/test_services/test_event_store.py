@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+from agent_server.services import event_store as event_store_module
+from agent_server.services.event_store import EventStore
+
+
+class FakeDriverConnection:
+    def __init__(self, copy_error=None, insert_error=None):
+        self.copy_error = copy_error
+        self.insert_error = insert_error
+        self.inserted = []
+
+    async def copy_records_to_table(self, _table, records, columns):
+        if self.copy_error:
+            raise self.copy_error
+        self.inserted.extend(records)
+
+    async def executemany(self, sql, records):
+        if self.insert_error:
+            raise self.insert_error
+        assert "ON CONFLICT (id) DO NOTHING" in sql
+        self.inserted.extend(records)
+
+
+class FakeEngine:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def connect(self):
+        engine = self
+
+        class _Conn:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *_exc):
+                return False
+
+            async def get_raw_connection(self):
+                class _Raw:
+                    driver_connection = engine.driver
+                return _Raw()
+
+        return _Conn()
+
+
+def _patch_engine(driver):
+    return patch.object(event_store_module.db_manager, "get_engine", return_value=FakeEngine(driver))
+
+
+async def test_flush_falls_back_to_insert_when_copy_fails():
+    store = EventStore()
+    driver = FakeDriverConnection(copy_error=RuntimeError("duplicate key"))
+    await store.append("run-1", "run-1_event_1", "values", b"{}")
+
+    with _patch_engine(driver):
+        await store.flush()
+
+    assert [r[0] for r in driver.inserted] == ["run-1_event_1"]
+    assert store._pending == []
+    store._flush_task.cancel()
+
+
+async def test_flush_requeues_failed_batch_then_drops_after_max_attempts():
+    store = EventStore()
+    store.FLUSH_RETRY_DELAY = 3600
+    driver = FakeDriverConnection(copy_error=RuntimeError("down"), insert_error=RuntimeError("down"))
+    await store.append("run-1", "run-1_event_1", "values", b"{}")
+
+    with _patch_engine(driver):
+        for _ in range(store.MAX_FLUSH_ATTEMPTS - 1):
+            await store.flush()
+            assert [r[0] for r in store._pending] == ["run-1_event_1"]
+        await store.flush()
+
+    assert store._pending == []
+    store._flush_task.cancel()
@@ -0,0 +1,26 @@
+from agent_server.services.langgraph_service import create_run_config
+
+
+class _User:
+    identity = "user-1"
+    display_name = "User One"
+
+    def to_dict(self):
+        return {"identity": self.identity}
+
+
+def test_run_config_merges_server_fields_without_mutating_input():
+    client_config = {"configurable": {"user_id": "spoofed", "model": "gpt"}, "tags": ["a"]}
+
+    cfg = create_run_config("run-1", "thread-1", _User(), client_config, {"checkpoint_id": "cp", "checkpoint_ns": None})
+
+    configurable = cfg["configurable"]
+    assert configurable["user_id"] == "user-1"
+    assert configurable["user_display_name"] == "User One"
+    assert configurable["thread_id"] == "thread-1"
+    assert configurable["run_id"] == "run-1"
+    assert configurable["checkpoint_id"] == "cp"
+    assert "checkpoint_ns" not in configurable
+    assert configurable["model"] == "gpt"
+    assert cfg["tags"] == ["a"]
+    assert client_config == {"configurable": {"user_id": "spoofed", "model": "gpt"}, "tags": ["a"]}
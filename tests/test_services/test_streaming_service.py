@@ -0,0 +1,23 @@
+import inspect
+
+from agent_server.services.broker import RunBroker
+from agent_server.services.streaming_service import StreamingService
+
+
+def test_stream_path_is_async_native():
+    # A sync generator would make StreamingResponse iterate it on the threadpool
+    assert inspect.isasyncgenfunction(StreamingService.stream_run_execution)
+    assert inspect.isasyncgenfunction(RunBroker.aiter_batches)
+
+
+def test_convert_raw_to_sse_dispatches_on_stream_mode():
+    service = StreamingService()
+
+    values = service._convert_raw_to_sse("run_event_1", ("values", {"a": 1}))
+    messages = service._convert_raw_to_sse("run_event_2", ("node", "messages", ({"c": 1}, {"m": 2})))
+    bare = service._convert_raw_to_sse("run_event_3", {"b": 2})
+
+    assert values.startswith("id: run_event_1\nevent: values\n")
+    assert messages.startswith("id: run_event_2\nevent: messages\n")
+    assert bare.startswith("id: run_event_3\nevent: values\n")
+    assert service._convert_raw_to_sse("run_event_4", ("unknown", {})) is None
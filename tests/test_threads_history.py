@@ -184,3 +184,26 @@ def test_history_invalid_limit(client: TestClient, mock_langgraph):
     # GET invalid metadata JSON
     resp = client.get(f"/threads/{thread_id}/history", params={"metadata": "{not-json"})
     assert resp.status_code == 422
+
+
+def test_history_before_is_passed_as_checkpoint_config(client: TestClient):
+    captured: Dict[str, Any] = {}
+
+    class CapturingAgent(FakeAgent):
+        async def aget_state_history(self, config, **kwargs):
+            captured.update(kwargs)
+            async for s in super().aget_state_history(config, **kwargs):
+                yield s
+
+    with patch_langgraph_service(agent=CapturingAgent([])):
+        thread_id = _ensure_thread(client)
+        resp = client.post(f"/threads/{thread_id}/history", json={"limit": 1, "before": "cp_2"})
+
+    assert resp.status_code == 200, resp.text
+    assert captured["limit"] == 1
+    assert captured["before"] == {"configurable": {"thread_id": thread_id, "checkpoint_id": "cp_2"}}
+
+
+def test_history_rejects_malformed_thread_id(client: TestClient, mock_langgraph):
+    resp = client.get("/threads/not-a-uuid/history")
+    assert resp.status_code == 422
@@ -0,0 +1,35 @@
+import time
+from uuid import UUID
+
+import pytest
+
+from agent_server.utils.ids import canonical_uuid, uuid7
+
+
+def test_uuid7_is_canonical_version_7():
+    value = uuid7()
+
+    parsed = UUID(value)
+    assert str(parsed) == value
+    assert parsed.version == 7
+    assert parsed.variant == "specified in RFC 4122"
+
+
+def test_uuid7_embeds_millisecond_timestamp_and_sorts_by_time():
+    before = time.time_ns() // 1_000_000
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert UUID(first).int >> 80 >= before
+    assert first < second
+
+
+def test_canonical_uuid_normalizes_case_and_format():
+    assert canonical_uuid("1111111111114111A111111111111111") == "11111111-1111-4111-a111-111111111111"
+
+
+@pytest.mark.parametrize("value", ["abc", "", "11111111-1111-1111-1111-11111111111z"])
+def test_canonical_uuid_rejects_non_uuid(value):
+    with pytest.raises(ValueError):
+        canonical_uuid(value)